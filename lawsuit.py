@@ -1,11 +1,112 @@
+import operator
+import pickle
+import sys
 from typing import List
 
+# Interned literal prefixes: plain concatenation with an already-allocated
+# prefix string is cheaper than rebuilding the literal in an f-string.
+_PLAINTIFF_PREFIX = sys.intern("Plaintiff: ")
+_DEFENDANT_PREFIX = sys.intern("Defendant: ")
+_FIRM_PREFIX = sys.intern("Firm: ")
+_COURT_PREFIX = sys.intern("Court: ")
+_CASE_INFO_PREFIX = sys.intern("Case Information: ")
+
+# Numbered line prefixes precomputed once, so rendering a document joins
+# prefix + text instead of evaluating an f-string per section/exhibit.
+# The tables grow lazily for unusually large documents.
+_SECTION_PREFIXES = [f"  {i}. " for i in range(1, 257)]
+_EXHIBIT_PREFIXES = [f"  Exhibit {i}: " for i in range(1, 257)]
+
+
+def _ensure_prefixes(prefixes: List[str], template: str, count: int) -> None:
+    """Extend a numbered-prefix table so it covers at least count entries."""
+    if count > len(prefixes):
+        prefixes.extend(
+            template.format(i) for i in range(len(prefixes) + 1, count + 1)
+        )
+
+
+def save_lawsuit(lawsuit: 'Lawsuit', path: str) -> None:
+    """
+    Pickle a lawsuit to the given path at the highest available protocol.
+
+    The default protocol predates the protocol-5 framing optimizations;
+    dumping at pickle.HIGHEST_PROTOCOL keeps saved files on the fastest
+    format the running interpreter supports. Out-of-band PickleBuffer
+    transfer is not used: the fields are str objects, which have no
+    buffer to export without first copying into bytes.
+
+    Parameters:
+        lawsuit (Lawsuit): The lawsuit to serialize.
+        path (str): The destination file path.
+    """
+    with open(path, 'wb') as pf:
+        pickle.dump(lawsuit, pf, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _lawsuit_rebuild(
+    heading: str,
+    plaintiff: str,
+    defendant: str,
+    case_information: str,
+    court_name: str,
+    firm_name: str,
+    footer: str,
+    body_sections: tuple,
+    exhibits: tuple
+) -> 'Lawsuit':
+    """
+    Rebuild a Lawsuit from pickled fields without running __init__.
+
+    The fields were validated when the original object was constructed,
+    so the copy is assembled by direct assignment via __new__.
+    """
+    obj = Lawsuit.__new__(Lawsuit)
+    obj.__setstate__((
+        heading, plaintiff, defendant, case_information,
+        court_name, firm_name, footer,
+        list(body_sections), list(exhibits)
+    ))
+    return obj
+
+
+def _validated(value: str, message: str) -> str:
+    """
+    Check that value is a non-empty string and return it stripped.
+
+    Parameters:
+        value (str): The candidate string.
+        message (str): The ValueError message to raise on failure.
+
+    Returns:
+        str: The stripped string.
+    """
+    if type(value) is not str or not (value := value.strip()):
+        raise ValueError(message)
+    return value
+
+
 class Lawsuit:
     """
     A class representing a lawsuit document that includes a heading, plaintiff, defendant, 
     case information, court name, firm name, ordered body sections, a footer, and ordered exhibits.
     """
 
+    __slots__ = (
+        'heading',
+        'plaintiff',
+        'defendant',
+        'case_information',
+        'court_name',
+        'firm_name',
+        'footer',
+        'body_sections',
+        'exhibits',
+        '_separator',
+        '_header_block',
+        '_doc_cache'
+    )
+
     def __init__(
         self,
         heading: str,
@@ -33,42 +134,72 @@ class Lawsuit:
             footer (str): The footer text of the lawsuit.
             exhibits (List[str]): A list of strings representing the ordered exhibits.
         """
-        # Validate required string fields
-        for field_name, field_value in [
-            ("Heading", heading),
-            ("Plaintiff", plaintiff),
-            ("Defendant", defendant),
-            ("Case information", case_information),
-            ("Court name", court_name),
-            ("Firm name", firm_name),
-            ("Footer", footer)
-        ]:
-            if not isinstance(field_value, str) or not field_value.strip():
-                raise ValueError(f"{field_name} must be a non-empty string.")
-
-        self.heading = heading.strip()
-        self.plaintiff = plaintiff.strip()
-        self.defendant = defendant.strip()
-        self.case_information = case_information.strip()
-        self.court_name = court_name.strip()
-        self.firm_name = firm_name.strip()
-        self.footer = footer.strip()
-
-        # Validate body_sections
+        # Validate required string fields inline: an exact `type` check is cheaper
+        # than isinstance, and each field is stripped exactly once with the result
+        # reused for both the emptiness test and the stored attribute.
+        if type(heading) is not str or not (heading := heading.strip()):
+            raise ValueError("Heading must be a non-empty string.")
+        if type(plaintiff) is not str or not (plaintiff := plaintiff.strip()):
+            raise ValueError("Plaintiff must be a non-empty string.")
+        if type(defendant) is not str or not (defendant := defendant.strip()):
+            raise ValueError("Defendant must be a non-empty string.")
+        if type(case_information) is not str or not (case_information := case_information.strip()):
+            raise ValueError("Case information must be a non-empty string.")
+        if type(court_name) is not str or not (court_name := court_name.strip()):
+            raise ValueError("Court name must be a non-empty string.")
+        if type(firm_name) is not str or not (firm_name := firm_name.strip()):
+            raise ValueError("Firm name must be a non-empty string.")
+        if type(footer) is not str or not (footer := footer.strip()):
+            raise ValueError("Footer must be a non-empty string.")
+
+        self.heading = heading
+        self._separator = "=" * len(heading)
+        self.plaintiff = plaintiff
+        self.defendant = defendant
+        self.case_information = case_information
+        self.court_name = court_name
+        self.firm_name = firm_name
+        self.footer = footer
+
+        # Validate and strip body_sections in one pass, keeping each strip result.
         if not isinstance(body_sections, list) or not body_sections:
             raise ValueError("Body sections must be a non-empty list of strings.")
+        cleaned_sections = []
+        append_section = cleaned_sections.append
         for idx, section in enumerate(body_sections):
-            if not isinstance(section, str) or not section.strip():
+            if type(section) is not str or not (section := section.strip()):
                 raise ValueError(f"Body section at index {idx} must be a non-empty string.")
-        self.body_sections = [section.strip() for section in body_sections]
+            append_section(section)
+        self.body_sections = cleaned_sections
 
-        # Validate exhibits
+        # Validate and strip exhibits the same way.
         if not isinstance(exhibits, list) or not exhibits:
             raise ValueError("Exhibits must be a non-empty list of strings.")
+        cleaned_exhibits = []
+        append_exhibit = cleaned_exhibits.append
         for idx, exhibit in enumerate(exhibits):
-            if not isinstance(exhibit, str) or not exhibit.strip():
+            if type(exhibit) is not str or not (exhibit := exhibit.strip()):
                 raise ValueError(f"Exhibit at index {idx} must be a non-empty string.")
-        self.exhibits = [exhibit.strip() for exhibit in exhibits]
+            append_exhibit(exhibit)
+        self.exhibits = cleaned_exhibits
+
+        # None of the header fields can change after construction, so the
+        # fixed header block is formatted once here instead of per render.
+        self._rebuild_header_block()
+
+    def _rebuild_header_block(self) -> None:
+        """Format the fixed header lines into the cached _header_block."""
+        self._doc_cache = None
+        self._header_block = "\n".join([
+            self.heading,
+            self._separator,
+            _PLAINTIFF_PREFIX + self.plaintiff,
+            _DEFENDANT_PREFIX + self.defendant,
+            _FIRM_PREFIX + self.firm_name,
+            _COURT_PREFIX + self.court_name,
+            _CASE_INFO_PREFIX + self.case_information,
+            ""
+        ])
 
     def add_body_section(self, section: str) -> None:
         """
@@ -77,9 +208,10 @@ class Lawsuit:
         Parameters:
             section (str): The text for the new body section.
         """
-        if not isinstance(section, str) or not section.strip():
-            raise ValueError("Section must be a non-empty string.")
-        self.body_sections.append(section.strip())
+        self.body_sections.append(
+            _validated(section, "Section must be a non-empty string.")
+        )
+        self._doc_cache = None
 
     def add_exhibit(self, exhibit: str) -> None:
         """
@@ -88,39 +220,178 @@ class Lawsuit:
         Parameters:
             exhibit (str): The text for the new exhibit.
         """
-        if not isinstance(exhibit, str) or not exhibit.strip():
-            raise ValueError("Exhibit must be a non-empty string.")
-        self.exhibits.append(exhibit.strip())
+        self.exhibits.append(
+            _validated(exhibit, "Exhibit must be a non-empty string.")
+        )
+        self._doc_cache = None
+
+    def extend_body_sections(self, sections: List[str]) -> None:
+        """
+        Add several body sections at once.
+
+        Validates the whole batch first, then grows the list with a single
+        extend call instead of one append per section.
+
+        Parameters:
+            sections (List[str]): The texts for the new body sections.
+        """
+        cleaned = []
+        append = cleaned.append
+        for section in sections:
+            if type(section) is not str or not (section := section.strip()):
+                raise ValueError("Section must be a non-empty string.")
+            append(section)
+        self.body_sections.extend(cleaned)
+        self._doc_cache = None
+
+    def extend_exhibits(self, exhibits: List[str]) -> None:
+        """
+        Add several exhibits at once.
+
+        Validates the whole batch first, then grows the list with a single
+        extend call instead of one append per exhibit.
+
+        Parameters:
+            exhibits (List[str]): The texts for the new exhibits.
+        """
+        cleaned = []
+        append = cleaned.append
+        for exhibit in exhibits:
+            if type(exhibit) is not str or not (exhibit := exhibit.strip()):
+                raise ValueError("Exhibit must be a non-empty string.")
+            append(exhibit)
+        self.exhibits.extend(cleaned)
+        self._doc_cache = None
+
+    @classmethod
+    def from_packed(
+        cls,
+        header: tuple,
+        body_blob: bytes,
+        body_offsets: List[int],
+        exhibit_blob: bytes,
+        exhibit_offsets: List[int]
+    ) -> 'Lawsuit':
+        """
+        Build a Lawsuit from packed section storage.
+
+        Bulk pipelines can keep the text of many lawsuits as one
+        contiguous UTF-8 blob per list field plus an offset table
+        (structure-of-arrays layout) and construct objects from slices,
+        decoding each section exactly once here. The resulting object
+        uses the normal list storage; the packed form is an ingest
+        format, not validated again.
+
+        Parameters:
+            header (tuple): The seven scalar fields in constructor order
+                (heading, plaintiff, defendant, case_information,
+                court_name, firm_name, footer).
+            body_blob (bytes): Concatenated UTF-8 body sections.
+            body_offsets (List[int]): len(sections)+1 slice boundaries into body_blob.
+            exhibit_blob (bytes): Concatenated UTF-8 exhibits.
+            exhibit_offsets (List[int]): len(exhibits)+1 slice boundaries into exhibit_blob.
+
+        Returns:
+            Lawsuit: The decoded lawsuit.
+        """
+        body_sections = [
+            body_blob[body_offsets[i]:body_offsets[i + 1]].decode('utf-8')
+            for i in range(len(body_offsets) - 1)
+        ]
+        exhibits = [
+            exhibit_blob[exhibit_offsets[i]:exhibit_offsets[i + 1]].decode('utf-8')
+            for i in range(len(exhibit_offsets) - 1)
+        ]
+        obj = cls.__new__(cls)
+        obj.__setstate__(header + (body_sections, exhibits))
+        return obj
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle through _lawsuit_rebuild so unpickling skips __init__
+        validation entirely.
+
+        The section and exhibit lists are passed as tuples, which pickle
+        more compactly than lists under recent protocols.
+
+        Returns:
+            tuple: The (callable, args) pair used by pickle.
+        """
+        return (_lawsuit_rebuild, (
+            self.heading,
+            self.plaintiff,
+            self.defendant,
+            self.case_information,
+            self.court_name,
+            self.firm_name,
+            self.footer,
+            tuple(self.body_sections),
+            tuple(self.exhibits)
+        ))
+
+    def __getstate__(self) -> tuple:
+        """
+        Return the pickled state as a tuple of the core fields.
+
+        Returns:
+            tuple: The nine validated attributes of the lawsuit.
+        """
+        return (
+            self.heading,
+            self.plaintiff,
+            self.defendant,
+            self.case_information,
+            self.court_name,
+            self.firm_name,
+            self.footer,
+            self.body_sections,
+            self.exhibits
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restore the pickled state directly, skipping __init__ validation:
+        the data was already validated when the object was first built.
+
+        Parameters:
+            state (tuple): The tuple produced by __getstate__.
+        """
+        (
+            self.heading,
+            self.plaintiff,
+            self.defendant,
+            self.case_information,
+            self.court_name,
+            self.firm_name,
+            self.footer,
+            self.body_sections,
+            self.exhibits
+        ) = state
+        self._separator = "=" * len(self.heading)
+        self._rebuild_header_block()
 
     def get_full_document(self) -> str:
         """
         Compile the full lawsuit document as a formatted string with header details,
         numbered body sections, and numbered exhibits.
 
+        The result is cached until the next mutator call, so repeated
+        stringification of an unchanged lawsuit formats only once.
+
         Returns:
             str: The complete formatted lawsuit document.
         """
-        separator = "=" * len(self.heading)
-        document_lines = [
-            self.heading,
-            separator,
-            f"Plaintiff: {self.plaintiff}",
-            f"Defendant: {self.defendant}",
-            f"Firm: {self.firm_name}",
-            f"Court: {self.court_name}",
-            f"Case Information: {self.case_information}",
-            ""
-        ]
-        document_lines.append("Body Sections:")
-        for idx, section in enumerate(self.body_sections, start=1):
-            document_lines.append(f"  {idx}. {section}")
-        document_lines.append("")
-        document_lines.append(self.footer)
-        document_lines.append("")
-        document_lines.append("Exhibits:")
-        for idx, exhibit in enumerate(self.exhibits, start=1):
-            document_lines.append(f"  Exhibit {idx}: {exhibit}")
-        return "\n".join(document_lines)
+        if self._doc_cache is not None:
+            return self._doc_cache
+        _ensure_prefixes(_SECTION_PREFIXES, "  {}. ", len(self.body_sections))
+        _ensure_prefixes(_EXHIBIT_PREFIXES, "  Exhibit {}: ", len(self.exhibits))
+        body = "\n".join(map(operator.add, _SECTION_PREFIXES, self.body_sections))
+        exhibits = "\n".join(map(operator.add, _EXHIBIT_PREFIXES, self.exhibits))
+        self._doc_cache = (
+            f"{self._header_block}\nBody Sections:\n{body}\n\n"
+            f"{self.footer}\n\nExhibits:\n{exhibits}"
+        )
+        return self._doc_cache
 
     def __str__(self) -> str:
         """
@@ -131,6 +402,21 @@ class Lawsuit:
         """
         return self.get_full_document()
 
+    def __repr__(self) -> str:
+        """
+        Return a short summary for debugging and logging.
+
+        Unlike __str__, this does not materialize the full document.
+
+        Returns:
+            str: A one-line summary of the lawsuit.
+        """
+        return (
+            f"Lawsuit(heading={self.heading!r}, "
+            f"sections={len(self.body_sections)}, "
+            f"exhibits={len(self.exhibits)})"
+        )
+
 
 if __name__ == '__main__':
     # Example usage:
@@ -0,0 +1,123 @@
+from typing import List, Sequence
+
+from lawsuit import Lawsuit
+
+# One (message, attribute) pair per scalar column, in constructor order.
+_SCALAR_COLUMNS = (
+    ("Heading must be a non-empty string.", "heading"),
+    ("Plaintiff must be a non-empty string.", "plaintiff"),
+    ("Defendant must be a non-empty string.", "defendant"),
+    ("Case information must be a non-empty string.", "case_information"),
+    ("Court name must be a non-empty string.", "court_name"),
+    ("Firm name must be a non-empty string.", "firm_name"),
+    ("Footer must be a non-empty string.", "footer"),
+)
+
+
+class LawsuitBatch:
+    """
+    A column-oriented store for building many Lawsuit objects at once.
+
+    Instead of constructing and validating each Lawsuit individually, the
+    batch keeps one list per field (structure-of-arrays layout) and
+    validates each column in a single tight loop, then materializes the
+    Lawsuit objects without re-running per-object validation.
+    """
+
+    __slots__ = ('columns',)
+
+    def __init__(
+        self,
+        headings: Sequence[str],
+        plaintiffs: Sequence[str],
+        defendants: Sequence[str],
+        case_informations: Sequence[str],
+        court_names: Sequence[str],
+        firm_names: Sequence[str],
+        footers: Sequence[str],
+        body_sections: Sequence[List[str]],
+        exhibits: Sequence[List[str]]
+    ) -> None:
+        """
+        Initialize the batch from parallel per-field sequences.
+
+        Parameters:
+            headings (Sequence[str]): One heading per lawsuit.
+            plaintiffs (Sequence[str]): One plaintiff per lawsuit.
+            defendants (Sequence[str]): One defendant per lawsuit.
+            case_informations (Sequence[str]): One case-information entry per lawsuit.
+            court_names (Sequence[str]): One court name per lawsuit.
+            firm_names (Sequence[str]): One firm name per lawsuit.
+            footers (Sequence[str]): One footer per lawsuit.
+            body_sections (Sequence[List[str]]): One list of body sections per lawsuit.
+            exhibits (Sequence[List[str]]): One list of exhibits per lawsuit.
+        """
+        scalar_columns = (
+            headings, plaintiffs, defendants, case_informations,
+            court_names, firm_names, footers
+        )
+        count = len(headings)
+        for column in scalar_columns[1:] + (body_sections, exhibits):
+            if len(column) != count:
+                raise ValueError("All batch columns must have the same length.")
+
+        # Validate and strip one column at a time: each loop touches a
+        # single homogeneous list, so the per-row validation overhead of
+        # building N Lawsuits individually is paid once per column instead.
+        cleaned = []
+        for (message, _), column in zip(_SCALAR_COLUMNS, scalar_columns):
+            cleaned_column = []
+            append = cleaned_column.append
+            for value in column:
+                if type(value) is not str or not (value := value.strip()):
+                    raise ValueError(message)
+                append(value)
+            cleaned.append(cleaned_column)
+
+        list_columns = (
+            ("Body sections", "Body section", body_sections),
+            ("Exhibits", "Exhibit", exhibits)
+        )
+        for plural, singular, column in list_columns:
+            cleaned_column = []
+            append = cleaned_column.append
+            for items in column:
+                if not isinstance(items, list) or not items:
+                    raise ValueError(f"{plural} must be a non-empty list of strings.")
+                cleaned_items = []
+                for idx, item in enumerate(items):
+                    if type(item) is not str or not (item := item.strip()):
+                        raise ValueError(f"{singular} at index {idx} must be a non-empty string.")
+                    cleaned_items.append(item)
+                append(cleaned_items)
+            cleaned.append(cleaned_column)
+
+        self.columns = cleaned
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def to_lawsuits(self) -> List[Lawsuit]:
+        """
+        Materialize the batch as a list of Lawsuit objects.
+
+        The columns were validated in __init__, so each object is built
+        with direct field assignment via __new__ rather than __init__.
+
+        Returns:
+            List[Lawsuit]: The lawsuits in batch order.
+        """
+        (headings, plaintiffs, defendants, case_informations,
+         court_names, firm_names, footers, body_sections, exhibits) = self.columns
+        lawsuits = []
+        append = lawsuits.append
+        new = Lawsuit.__new__
+        for i in range(len(headings)):
+            obj = new(Lawsuit)
+            obj.__setstate__((
+                headings[i], plaintiffs[i], defendants[i],
+                case_informations[i], court_names[i], firm_names[i],
+                footers[i], body_sections[i], exhibits[i]
+            ))
+            append(obj)
+        return lawsuits
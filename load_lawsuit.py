@@ -1,14 +1,67 @@
 #!/usr/bin/env python3
 
-import pickle
+# Prefer the compiled cycloudpickle drop-in when installed; it reads the
+# same on-wire format as the standard library, just faster.
+try:
+    import cycloudpickle as pickle
+except ImportError:
+    import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+def load_many(paths, max_workers=None):
+    """
+    Load many pickle files concurrently and return the objects in order.
+
+    File reads release the GIL, so a thread pool overlaps the disk waits
+    of cold-cache loads instead of paying each file's latency serially.
+    Only worth using for bulk loads from disk; for files already in the
+    page cache the plain sequential path is just as fast.
+
+    Returns a list of the loaded objects in the order of `paths`.
+    """
+    def _load_one(path):
+        with open(path, 'rb') as pf:
+            return pickle.loads(pf.read())
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_load_one, paths))
+
+def bulk_load_lawsuits(paths):
+    """
+    Deserialize many individually pickled Lawsuit objects with a single
+    pickle.loads call.
+
+    The payload of each file is stripped of its 2-byte PROTO prefix and
+    trailing STOP opcode, and the remainders are concatenated into one
+    synthetic LIST pickle (EMPTY_LIST + MARK + payloads + APPENDS + STOP),
+    so one Unpickler and one memo table are reused for the whole batch.
+    Assumes each file was written at pickle protocol 2 (a 2-byte header).
+
+    Returns a list of the loaded objects in the order of `paths`.
+    """
+    if not paths:
+        return []
+    parts = [pickle.EMPTY_LIST, pickle.MARK]
+    for path in paths:
+        with open(path, 'rb') as pf:
+            payload = pf.read()
+        parts.append(payload[2:-1])  # drop PROTO header and STOP opcode
+    parts.append(pickle.APPENDS)
+    parts.append(pickle.STOP)
+    return pickle.loads(b"".join(parts))
 
 def main():
     pickle_filename = "lawsuit.pickle"  # Adjust if you saved to a different filename
 
+    # Read the whole file up front so the unpickler works against an
+    # in-memory buffer instead of issuing per-opcode file reads.
     with open(pickle_filename, 'rb') as pf:
-        loaded_obj = pickle.load(pf)
-        print("Loaded Lawsuit object from pickle:")
-        print(loaded_obj)
+        data = pf.read()
+    loaded_obj = pickle.loads(data)
+    print("Loaded Lawsuit object from pickle:")
+    print(loaded_obj)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,8 +5,7 @@ for Bo Shang, who receives Medicaid in MA, with believable information.
 This script prints out the finalized form text.
 """
 
-def generate_fee_waiver_form():
-    form_text = f"""
+_FEE_WAIVER_FORM = """
     Court of Washington
 For    King County  (Example)
     
@@ -129,7 +128,8 @@ Date: February 13, 2025        Signature:  _Bo Shang_____________
                                            (Bo Shang)
     """
 
-    return form_text
+def generate_fee_waiver_form():
+    return _FEE_WAIVER_FORM
 
 if __name__ == "__main__":
     completed_form = generate_fee_waiver_form()
@@ -26,22 +26,63 @@ a DOCX version, a PDF and DOCX table of contents, and optionally a pickle of the
 """
 
 import argparse
+import functools
+import gc
+import io
+import json
 import re
 import pickle
 import os
-from collections import OrderedDict
+import string
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional fast JSON codec; falls back to the standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # PDF-related imports
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+
+# Inch-denominated layout scalars, folded to floats once at import.  These
+# sit on the per-line and per-page drawing paths, where each `x * inch`
+# would otherwise be a fresh multiply on every call.
+_INCH_0_2 = 0.2 * inch
+_INCH_0_25 = 0.25 * inch
+_INCH_0_3 = 0.3 * inch
+_INCH_0_4 = 0.4 * inch
+_INCH_0_5 = 0.5 * inch
+_INCH_0_6 = 0.6 * inch
+_INCH_0_75 = 0.75 * inch
+_INCH_1_0 = 1.0 * inch
+_INCH_1_2 = 1.2 * inch
+_INCH_1_3 = 1.3 * inch
+_INCH_1_5 = 1.5 * inch
+
+# TOC page capacity, partially evaluated at import: usable height (letter
+# page minus one-inch top/bottom margins and the title band) divided by
+# the quarter-inch line spacing.
+_TOC_MAX_LINES_PER_PAGE = int((letter[1] - (_INCH_1_0 + _INCH_1_0) - _INCH_1_0) // _INCH_0_25)
 
 # DOCX-related imports
 import docx
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
 from docx.shared import Pt, Inches
+from xml.sax.saxutils import escape
+
+# Run sizes built once; Pt() redoes its EMU conversion on every call.
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+_PT14 = Pt(14)
 
 
 ###############################################################################
@@ -49,18 +90,28 @@ from docx.shared import Pt, Inches
 ###############################################################################
 class Lawsuit:
     """
-    A container for Lawsuit data, with each attribute stored as an OrderedDict:
-      - header:   an OrderedDict for storing top-level metadata.
-      - sections: an OrderedDict with each key as "HEADING_NUMBER HEADING_TEXT"
+    A container for Lawsuit data, with each attribute stored as an
+    insertion-ordered dict:
+      - header:   a dict for storing top-level metadata.
+      - sections: a dict with each key as "HEADING_NUMBER HEADING_TEXT"
                   (e.g. "1. INTRODUCTION" or "I. INTRODUCTION"),
                   and each value as the full text of that heading.
-      - exhibits: an OrderedDict keyed by a simple index string ("1", "2", etc.).
-                  Each value is another OrderedDict with 'caption' and 'image_path'.
-      - documents: an OrderedDict for storing entire detected bracketed documents.
+      - exhibits: a dict keyed by a simple index string ("1", "2", etc.).
+                  Each value is another dict with 'caption' and 'image_path'.
+      - documents: a dict for storing entire detected bracketed documents.
+
+    Plain dicts preserve insertion order on every supported Python and
+    avoid OrderedDict's extra linked list per mapping.
 
     Also stores case_information and law_firm_information from CLI arguments.
     """
 
+    # Fixed attribute set: no per-instance __dict__.
+    __slots__ = (
+        'sections', 'exhibits', 'header', 'documents',
+        'case_information', 'law_firm_information'
+    )
+
     def __init__(
         self,
         sections=None,
@@ -70,76 +121,127 @@ class Lawsuit:
         case_information="",
         law_firm_information=""
     ):
-        if sections is None:
-            sections = OrderedDict()
-        if exhibits is None:
-            exhibits = OrderedDict()
-        if header is None:
-            header = OrderedDict()
-        if documents is None:
-            documents = OrderedDict()
-
-        # Ensure they are all OrderedDict:
-        self.sections = OrderedDict(sections)
-        self.exhibits = OrderedDict(exhibits)
-        self.header = OrderedDict(header)
-        self.documents = OrderedDict(documents)
+        # Copy so the Lawsuit owns its mappings:
+        self.sections = dict(sections) if sections else {}
+        self.exhibits = dict(exhibits) if exhibits else {}
+        self.header = dict(header) if header else {}
+        self.documents = dict(documents) if documents else {}
 
         # Store the command-line-provided info
         self.case_information = case_information
         self.law_firm_information = law_firm_information
 
+    def to_dict(self):
+        """Plain-mapping view of the lawsuit, suitable for JSON output."""
+        return {
+            "header": self.header,
+            "sections": self.sections,
+            "exhibits": self.exhibits,
+            "documents": self.documents,
+            "case_information": self.case_information,
+            "law_firm_information": self.law_firm_information,
+        }
+
+    def save_json(self, path):
+        """
+        Serialize the lawsuit to JSON at `path`.  Unlike pickle, the result
+        is safe to load elsewhere and decodes without running a stack
+        machine; orjson is used when installed.
+        """
+        mapping = self.to_dict()
+        if orjson is not None:
+            payload = orjson.dumps(mapping)
+        else:
+            payload = json.dumps(mapping, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as jf:
+            jf.write(payload)
+
     def __repr__(self):
         """
-        Print the Lawsuit object clearly, showing all keys and values in each OrderedDict,
+        Print the Lawsuit object clearly, showing all keys and values in each dict,
         as well as the case_information and law_firm_information fields.
         """
-        header_str = "\n".join([f"  {k}: {v}" for k, v in self.header.items()])
-        sections_str = "\n".join([f"  {sec_key}: {sec_value}" for sec_key, sec_value in self.sections.items()])
-        exhibits_str = []
-        for ex_key, ex_data in self.exhibits.items():
-            ex_inner = "\n      ".join([f"{ik}: {iv}" for ik, iv in ex_data.items()])
-            exhibits_str.append(f"  {ex_key}:\n      {ex_inner}")
-        exhibits_str = "\n".join(exhibits_str)
-
-        documents_str = []
-        for doc_key, doc_text in self.documents.items():
-            documents_str.append(f"  {doc_key}:\n      {doc_text}")
-        documents_str = "\n".join(documents_str)
-
-        return (
+        # Stream every piece into one buffer; the old per-dict joins built
+        # an intermediate list and string for each block and then copied
+        # them all again into the final result.
+        buf = io.StringIO()
+        write = buf.write
+        write(
             "Lawsuit Object:\n\n"
             "CASE INFORMATION:\n"
             f"  {self.case_information}\n\n"
             "LAW FIRM INFORMATION:\n"
             f"  {self.law_firm_information}\n\n"
             "HEADER:\n"
-            f"{header_str}\n\n"
-            "SECTIONS:\n"
-            f"{sections_str}\n\n"
-            "EXHIBITS:\n"
-            f"{exhibits_str}\n\n"
-            "DOCUMENTS:\n"
-            f"{documents_str}\n"
         )
+        sep = ""
+        for k, v in self.header.items():
+            write(f"{sep}  {k}: {v}")
+            sep = "\n"
+        write("\n\nSECTIONS:\n")
+        sep = ""
+        for sec_key, sec_value in self.sections.items():
+            write(f"{sep}  {sec_key}: {sec_value}")
+            sep = "\n"
+        write("\n\nEXHIBITS:\n")
+        sep = ""
+        for ex_key, ex_data in self.exhibits.items():
+            write(f"{sep}  {ex_key}:\n      ")
+            inner_sep = ""
+            for ik, iv in ex_data.items():
+                write(f"{inner_sep}{ik}: {iv}")
+                inner_sep = "\n      "
+            sep = "\n"
+        write("\n\nDOCUMENTS:\n")
+        sep = ""
+        for doc_key, doc_text in self.documents.items():
+            write(f"{sep}  {doc_key}:\n      {doc_text}")
+            sep = "\n"
+        write("\n")
+        return buf.getvalue()
 
 
 ###############################################################################
 #  HELPER FUNCTIONS (for PDF creation)
 ###############################################################################
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+
 def is_line_all_caps(line_str):
     """Returns True if the line has at least one uppercase letter and no lowercase letters."""
-    if not re.search(r'[A-Z]', line_str):
-        return False
-    return not re.search(r'[a-z]', line_str)
-
-def wrap_text_to_lines(pdf_canvas, full_text, font_name, font_size, max_width):
+    # One pass over the characters instead of two regex scans.  str.isupper()
+    # is not a drop-in here: it also considers non-ASCII cased characters,
+    # which the original [A-Z]/[a-z] patterns deliberately ignored.
+    has_upper = False
+    for ch in line_str:
+        if ch in _ASCII_LOWER:
+            return False
+        if ch in _ASCII_UPPER:
+            has_upper = True
+    return has_upper
+
+@functools.lru_cache(maxsize=65536)
+def _word_width(word, font_name, font_size):
+    """Memoized width of a single token; legal prose repeats most tokens."""
+    return pdfmetrics.stringWidth(word, font_name, font_size)
+
+@functools.lru_cache(maxsize=16384)
+def _string_width(text, font_name, font_size):
+    """Memoized width of a whole line, for the fits-as-is fast path."""
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+@functools.lru_cache(maxsize=8192)
+def wrap_text_to_lines(full_text, font_name, font_size, max_width):
     """
     Splits a large text into (line_string, ended_full_line) pairs, respecting max_width
     so that text does not overflow horizontally in the PDF.
     ended_full_line is True if that line was 'full' and caused the next word to wrap.
+    Measurement is metric-table based, so no canvas is involved.  Results are
+    memoized per (text, font, size, width): repeated captions and headings
+    skip tokenization and measurement entirely, so the return value is an
+    immutable tuple.
     """
-    pdf_canvas.setFont(font_name, font_size)
+    space_width = _word_width(" ", font_name, font_size)
     paragraphs = full_text.split('\n')
     all_lines = []
     for paragraph in paragraphs:
@@ -148,17 +250,32 @@ def wrap_text_to_lines(pdf_canvas, full_text, font_name, font_size, max_width):
             # Empty line
             all_lines.append(("", False))
             continue
-        current_line = ""
-        for word in words:
-            test_line = word if not current_line else (current_line + " " + word)
-            if pdf_canvas.stringWidth(test_line, font_name, font_size) <= max_width:
-                current_line = test_line
+        # Most headings and TOC entries fit on one line: settle those with
+        # a single whole-string measurement before any per-word work.
+        normalized = " ".join(words)
+        if _string_width(normalized, font_name, font_size) <= max_width:
+            all_lines.append((normalized, False))
+            continue
+        # Measure each word exactly once.  The standard fonts carry no
+        # kerning, so a line's width equals the sum of its word widths plus
+        # the separating spaces; there is no need to re-measure the whole
+        # growing prefix for every candidate word.
+        word_widths = [_word_width(word, font_name, font_size) for word in words]
+        start = 0
+        current_width = 0.0
+        for k, word_width in enumerate(word_widths):
+            if k == start:
+                candidate = word_width
             else:
-                all_lines.append((current_line, True))
-                current_line = word
-        if current_line:
-            all_lines.append((current_line, False))
-    return all_lines
+                candidate = current_width + space_width + word_width
+            if candidate <= max_width:
+                current_width = candidate
+            else:
+                all_lines.append((" ".join(words[start:k]), True))
+                start = k
+                current_width = word_width
+        all_lines.append((" ".join(words[start:]), False))
+    return tuple(all_lines)
 
 def draw_firm_name_vertical_center(pdf_canvas, text, page_width, page_height):
     """
@@ -167,7 +284,7 @@ def draw_firm_name_vertical_center(pdf_canvas, text, page_width, page_height):
     pdf_canvas.saveState()
     pdf_canvas.setFont("Helvetica-Bold", 10)  # Using a more universal font for the box characters
     text_width = pdf_canvas.stringWidth(text, "Helvetica-Bold", 10)
-    x_pos = 0.2 * inch
+    x_pos = _INCH_0_2
     y_center = page_height / 2.0
     y_pos = y_center - (text_width / 2.0)
     pdf_canvas.translate(x_pos, y_pos)
@@ -186,6 +303,37 @@ def draw_checkbox_line(pdf_canvas, text, x, y):
 ###############################################################################
 #  COVER SHEET (PDF)
 ###############################################################################
+# The cover sheet is static text; keeping it in one module-level tuple lets
+# both the PDF and DOCX writers draw it with a simple loop, and the constant
+# lives in the compiled module instead of being rebuilt per call.
+_COVER_SHEET_LINES = (
+    "1. COURT: KING COUNTY SUPERIOR COURT",
+    "2. CASE ASSIGNMENT AREA:   ☐ Kent     ☒ Seattle",
+    "3. CASE TITLE: Bo Shang v. Amazon.com, Inc.",
+    "4. CASE NUMBER (Clerk to Assign): ______________________",
+    "5. CASE CATEGORY (Check one):   ☒ Civil",
+    "6. CASE TYPE:   ☒ TTO – Tort/Other",
+    "7. DOCUMENT/S BEING FILED:",
+    "   ☐ Initial Pleadings and Petitions",
+    "   ☐ Additional/Amended Pleadings",
+    "   ☒ Complaint for Tort – Other (CMPTTO)",
+    "   ☒ Summons",
+    "8. RELIEF REQUESTED:",
+    "   ☒ Damages",
+    "   ☒ Injunctive Relief",
+    "   ☐ Other: ____________________",
+    "9. JURY DEMAND:",
+    "   ☒ Yes",
+    "   ☐ No",
+    "10. ATTORNEY OR PARTY SIGNING COVER SHEET:",
+    "   Name:      Bo Shang (Plaintiff Pro Se)",
+    "   Address:   10 McCafferty Way",
+    "              Burlington, MA 01803-3127",
+    "   Phone:     781-999-4101",
+    "   Email:     enigmatictyphoon@gmail.com",
+    "   WSBA No.:  Pro Se",
+)
+
 def generate_cover_sheet_pdf(pdf_canvas, page_width, page_height):
     """
     Generate the first page as a cover sheet with the specified checkboxes
@@ -218,121 +366,21 @@ def generate_cover_sheet_pdf(pdf_canvas, page_width, page_height):
     """
 
     pdf_canvas.setFont("Helvetica", 12)
-    left_margin = 1.0 * inch
-    top_position = page_height - 1.0 * inch
+    left_margin = _INCH_1_0
+    top_position = page_height - _INCH_1_0
     line_height = 18  # points (about 0.25 inch)
     current_y = top_position
 
     # Title / bounding
     pdf_canvas.setLineWidth(2)
-    pdf_canvas.rect(0.5 * inch, 0.5 * inch, page_width - 1.0 * inch, page_height - 1.0 * inch)
-
-    # 1. COURT
-    line1 = "1. COURT: KING COUNTY SUPERIOR COURT"
-    pdf_canvas.drawString(left_margin, current_y, line1)
-    current_y -= line_height
-
-    # 2. CASE ASSIGNMENT AREA
-    line2 = "2. CASE ASSIGNMENT AREA:   ☐ Kent     ☒ Seattle"
-    pdf_canvas.drawString(left_margin, current_y, line2)
-    current_y -= line_height
-
-    # 3. CASE TITLE
-    line3 = "3. CASE TITLE: Bo Shang v. Amazon.com, Inc."
-    pdf_canvas.drawString(left_margin, current_y, line3)
-    current_y -= line_height
-
-    # 4. CASE NUMBER
-    line4 = "4. CASE NUMBER (Clerk to Assign): ______________________"
-    pdf_canvas.drawString(left_margin, current_y, line4)
-    current_y -= line_height
-
-    # 5. CASE CATEGORY
-    line5 = "5. CASE CATEGORY (Check one):   ☒ Civil"
-    pdf_canvas.drawString(left_margin, current_y, line5)
-    current_y -= line_height
-
-    # 6. CASE TYPE
-    line6 = "6. CASE TYPE:   ☒ TTO – Tort/Other"
-    pdf_canvas.drawString(left_margin, current_y, line6)
-    current_y -= line_height
-
-    # 7. DOCUMENTS BEING FILED
-    pdf_canvas.drawString(left_margin, current_y, "7. DOCUMENT/S BEING FILED:")
-    current_y -= line_height
-
-    docs_line1 = "   ☐ Initial Pleadings and Petitions"
-    pdf_canvas.drawString(left_margin, current_y, docs_line1)
-    current_y -= line_height
-
-    docs_line2 = "   ☐ Additional/Amended Pleadings"
-    pdf_canvas.drawString(left_margin, current_y, docs_line2)
-    current_y -= line_height
-
-    docs_line3 = "   ☒ Complaint for Tort – Other (CMPTTO)"
-    pdf_canvas.drawString(left_margin, current_y, docs_line3)
-    current_y -= line_height
-
-    docs_line4 = "   ☒ Summons"
-    pdf_canvas.drawString(left_margin, current_y, docs_line4)
-    current_y -= line_height
-
-    # 8. RELIEF REQUESTED
-    pdf_canvas.drawString(left_margin, current_y, "8. RELIEF REQUESTED:")
-    current_y -= line_height
-
-    relief_line1 = "   ☒ Damages"
-    pdf_canvas.drawString(left_margin, current_y, relief_line1)
-    current_y -= line_height
-
-    relief_line2 = "   ☒ Injunctive Relief"
-    pdf_canvas.drawString(left_margin, current_y, relief_line2)
-    current_y -= line_height
-
-    relief_line3 = "   ☐ Other: ____________________"
-    pdf_canvas.drawString(left_margin, current_y, relief_line3)
-    current_y -= line_height
-
-    # 9. JURY DEMAND
-    pdf_canvas.drawString(left_margin, current_y, "9. JURY DEMAND:")
-    current_y -= line_height
-
-    jury_line1 = "   ☒ Yes"
-    pdf_canvas.drawString(left_margin, current_y, jury_line1)
-    current_y -= line_height
-
-    jury_line2 = "   ☐ No"
-    pdf_canvas.drawString(left_margin, current_y, jury_line2)
-    current_y -= line_height
+    pdf_canvas.rect(_INCH_0_5, _INCH_0_5, page_width - _INCH_1_0, page_height - _INCH_1_0)
 
-    # 10. ATTORNEY OR PARTY SIGNING COVER SHEET
-    pdf_canvas.drawString(left_margin, current_y, "10. ATTORNEY OR PARTY SIGNING COVER SHEET:")
-    current_y -= line_height
+    for line in _COVER_SHEET_LINES:
+        pdf_canvas.drawString(left_margin, current_y, line)
+        current_y -= line_height
 
-    name_line = "   Name:      Bo Shang (Plaintiff Pro Se)"
-    pdf_canvas.drawString(left_margin, current_y, name_line)
-    current_y -= line_height
-
-    addr_line1 = "   Address:   10 McCafferty Way"
-    pdf_canvas.drawString(left_margin, current_y, addr_line1)
-    current_y -= line_height
-
-    addr_line2 = "              Burlington, MA 01803-3127"
-    pdf_canvas.drawString(left_margin, current_y, addr_line2)
-    current_y -= line_height
-
-    phone_line = "   Phone:     781-999-4101"
-    pdf_canvas.drawString(left_margin, current_y, phone_line)
-    current_y -= line_height
-
-    email_line = "   Email:     enigmatictyphoon@gmail.com"
-    pdf_canvas.drawString(left_margin, current_y, email_line)
-    current_y -= line_height
-
-    wsba_line = "   WSBA No.:  Pro Se"
-    pdf_canvas.drawString(left_margin, current_y, wsba_line)
-    current_y -= line_height
 
+_WORDML_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
 def generate_cover_sheet_docx(doc: Document):
     """
@@ -342,43 +390,25 @@ def generate_cover_sheet_docx(doc: Document):
     style = doc.styles['Normal']
     font = style.font
     font.name = 'Times New Roman'
-    font.size = Pt(12)
-
-    def add_line(text, bold=False):
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        r = p.add_run(text)
-        r.bold = bold
-
-    add_line("1. COURT: KING COUNTY SUPERIOR COURT")
-    add_line("2. CASE ASSIGNMENT AREA:   ☐ Kent     ☒ Seattle")
-    add_line("3. CASE TITLE: Bo Shang v. Amazon.com, Inc.")
-    add_line("4. CASE NUMBER (Clerk to Assign): ______________________")
-    add_line("5. CASE CATEGORY (Check one):   ☒ Civil")
-    add_line("6. CASE TYPE:   ☒ TTO – Tort/Other")
-
-    add_line("7. DOCUMENT/S BEING FILED:")
-    add_line("   ☐ Initial Pleadings and Petitions")
-    add_line("   ☐ Additional/Amended Pleadings")
-    add_line("   ☒ Complaint for Tort – Other (CMPTTO)")
-    add_line("   ☒ Summons")
-
-    add_line("8. RELIEF REQUESTED:")
-    add_line("   ☒ Damages")
-    add_line("   ☒ Injunctive Relief")
-    add_line("   ☐ Other: ____________________")
-
-    add_line("9. JURY DEMAND:")
-    add_line("   ☒ Yes")
-    add_line("   ☐ No")
-
-    add_line("10. ATTORNEY OR PARTY SIGNING COVER SHEET:")
-    add_line("   Name:      Bo Shang (Plaintiff Pro Se)")
-    add_line("   Address:   10 McCafferty Way")
-    add_line("              Burlington, MA 01803-3127")
-    add_line("   Phone:     781-999-4101")
-    add_line("   Email:     enigmatictyphoon@gmail.com")
-    add_line("   WSBA No.:  Pro Se")
+    font.size = _PT12
+
+    # The cover sheet is fixed text, so its paragraphs are rendered as one
+    # XML fragment and spliced into the body in bulk rather than paying a
+    # style-resolving add_paragraph/add_run round trip for each line.
+    paragraphs_xml = "".join(
+        '<w:p><w:pPr><w:jc w:val="left"/></w:pPr>'
+        '<w:r><w:rPr><w:b w:val="0"/></w:rPr>'
+        f'<w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+        for line in _COVER_SHEET_LINES
+    )
+    fragment = parse_xml(f'<w:body xmlns:w="{_WORDML_NS}">{paragraphs_xml}</w:body>')
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    for paragraph in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
 
 
 ###############################################################################
@@ -401,30 +431,28 @@ def draw_exhibit_page(
     """
     # Bounding box
     pdf_canvas.setLineWidth(2)
-    pdf_canvas.rect(0.5 * inch, 0.5 * inch, page_width - 1.0 * inch, page_height - 1.3 * inch)
+    pdf_canvas.rect(_INCH_0_5, _INCH_0_5, page_width - _INCH_1_0, page_height - _INCH_1_3)
 
     # Vertical firm name
     draw_firm_name_vertical_center(pdf_canvas, firm_name, page_width, page_height)
 
     # Case name at top center
     pdf_canvas.setFont("Helvetica-Bold", 12)
-    pdf_canvas.drawCentredString(page_width / 2.0, page_height - 0.5 * inch, case_name)
+    pdf_canvas.drawCentredString(page_width / 2.0, page_height - _INCH_0_5, case_name)
 
     # Horizontal line
     pdf_canvas.setLineWidth(1)
-    pdf_canvas.line(0.5 * inch, page_height - 0.6 * inch, page_width - 0.5 * inch, page_height - 0.6 * inch)
+    pdf_canvas.line(_INCH_0_5, page_height - _INCH_0_6, page_width - _INCH_0_5, page_height - _INCH_0_6)
 
     # Draw the exhibit caption
     pdf_canvas.setFont("Helvetica", 10)
-    top_margin = page_height - 1.2 * inch
-    left_margin = 1.2 * inch
-    line_spacing = 0.25 * inch
+    top_margin = page_height - _INCH_1_2
+    left_margin = _INCH_1_2
+    line_spacing = _INCH_0_25
     max_caption_width = page_width - (2 * left_margin)
 
     # Wrap the caption
-    from reportlab.pdfgen import canvas as dummy
-    temp_c = dummy.Canvas("dummy", pagesize=letter)
-    wrapped_caption_lines = wrap_text_to_lines(temp_c, exhibit_caption, "Helvetica", 10, max_caption_width)
+    wrapped_caption_lines = wrap_text_to_lines(exhibit_caption, "Helvetica", 10, max_caption_width)
 
     current_y = top_margin
     for (cap_line, _) in wrapped_caption_lines:
@@ -433,14 +461,19 @@ def draw_exhibit_page(
 
     # We only want 1 blank line below the last caption line:
     top_of_image_area = current_y - line_spacing
-    bottom_of_image_area = 0.5 * inch
+    bottom_of_image_area = _INCH_0_5
     if top_of_image_area < bottom_of_image_area:
         top_of_image_area = bottom_of_image_area
     available_height = top_of_image_area - bottom_of_image_area
-    available_width = page_width - 1.0 * inch  # bounding box left 0.5", right 0.5"
+    available_width = page_width - _INCH_1_0  # bounding box left 0.5", right 0.5"
 
     try:
-        img_reader = ImageReader(exhibit_image)
+        # A prefetched ImageReader may be handed in directly; only raw
+        # paths/streams still need decoding here.
+        if isinstance(exhibit_image, ImageReader):
+            img_reader = exhibit_image
+        else:
+            img_reader = ImageReader(exhibit_image)
         img_width, img_height = img_reader.getSize()
     except Exception as e:
         # If image loading fails, place a message in the middle
@@ -456,7 +489,7 @@ def draw_exhibit_page(
         new_width = img_width * scale
         new_height = img_height * scale
 
-        x_img = 0.5 * inch + (available_width - new_width) / 2.0
+        x_img = _INCH_0_5 + (available_width - new_width) / 2.0
         y_img_bottom = bottom_of_image_area
 
         pdf_canvas.drawImage(
@@ -472,7 +505,7 @@ def draw_exhibit_page(
     # Footer with page number
     pdf_canvas.setFont("Helvetica-Oblique", 9)
     footer_text = f"Page {page_number} of {total_pages}"
-    pdf_canvas.drawCentredString(page_width / 2.0, 0.4 * inch, footer_text)
+    pdf_canvas.drawCentredString(page_width / 2.0, _INCH_0_4, footer_text)
 
 
 ###############################################################################
@@ -484,39 +517,31 @@ def is_full_equals_line(line_str):
     and has at least 5 '=' chars.
     """
     stripped = line_str.strip()
-    if len(stripped) < 5:
-        return False
-    return bool(re.match(r'^[=]+$', stripped))
+    # lstrip('=') empties the string iff every character is '='; it is a
+    # single C call, cheaper than stepping a regex over the line.
+    return len(stripped) >= 5 and not stripped.lstrip('=')
 
 def detect_legal_title_blocks(lines):
     """
     Given lines, yields either ("legal_page_title_block", [blocklines]) or ("normal_line", line).
     A block is bracketed by lines of '====='.
     """
+    # Run the delimiter predicate over every line once up front and pair the
+    # hits off as (top, bottom) brackets, instead of nesting a bottom-seeking
+    # scan inside the per-line loop.  A trailing unpaired '=====' line falls
+    # through as a normal line, exactly as before.
+    equals_indices = [idx for idx, line in enumerate(lines) if is_full_equals_line(line)]
+    block_bottoms = {}
+    for pair_start in range(0, len(equals_indices) - 1, 2):
+        block_bottoms[equals_indices[pair_start]] = equals_indices[pair_start + 1]
+
     i = 0
     n = len(lines)
     while i < n:
-        if is_full_equals_line(lines[i]):
-            # found top bracket
-            j = i + 1
-            inner_lines = []
-            found_bottom = False
-            while j < n:
-                if is_full_equals_line(lines[j]):
-                    found_bottom = True
-                    j += 1
-                    break
-                else:
-                    inner_lines.append(lines[j])
-                j += 1
-
-            if found_bottom:
-                yield ("legal_page_title_block", inner_lines)
-                i = j
-            else:
-                # no matching bottom bracket
-                yield ("normal_line", lines[i])
-                i += 1
+        bottom = block_bottoms.get(i)
+        if bottom is not None:
+            yield ("legal_page_title_block", lines[i + 1:bottom])
+            i = bottom + 1
         else:
             yield ("normal_line", lines[i])
             i += 1
@@ -540,23 +565,23 @@ def draw_legal_page_title_block(
     """
     # Bounding box
     pdf_canvas.setLineWidth(2)
-    pdf_canvas.rect(0.5 * inch, 0.5 * inch, page_width - 1.0 * inch, page_height - 1.3 * inch)
+    pdf_canvas.rect(_INCH_0_5, _INCH_0_5, page_width - _INCH_1_0, page_height - _INCH_1_3)
 
     # Vertical firm name
     draw_firm_name_vertical_center(pdf_canvas, firm_name, page_width, page_height)
 
     # Case name at top
     pdf_canvas.setFont("Helvetica-Bold", 12)
-    pdf_canvas.drawCentredString(page_width / 2.0, page_height - 0.5 * inch, case_name)
+    pdf_canvas.drawCentredString(page_width / 2.0, page_height - _INCH_0_5, case_name)
 
     # Horizontal line
     pdf_canvas.setLineWidth(1)
-    pdf_canvas.line(0.5 * inch, page_height - 0.6 * inch, page_width - 0.5 * inch, page_height - 0.6 * inch)
+    pdf_canvas.line(_INCH_0_5, page_height - _INCH_0_6, page_width - _INCH_0_5, page_height - _INCH_0_6)
 
     # Big bold lines in center
     pdf_canvas.setFont("Helvetica-Bold", 14)
-    line_spacing = 0.3 * inch
-    y_text = page_height - 1.5 * inch
+    line_spacing = _INCH_0_3
+    y_text = page_height - _INCH_1_5
     for line_str in block_lines:
         pdf_canvas.drawCentredString(page_width / 2.0, y_text, line_str)
         y_text -= line_spacing
@@ -564,7 +589,7 @@ def draw_legal_page_title_block(
     # Footer
     pdf_canvas.setFont("Helvetica-Oblique", 9)
     footer_text = f"Page {page_number} of {total_pages}"
-    pdf_canvas.drawCentredString(page_width / 2.0, 0.4 * inch, footer_text)
+    pdf_canvas.drawCentredString(page_width / 2.0, _INCH_0_4, footer_text)
 
 
 def draw_page_of_segments(
@@ -589,79 +614,91 @@ def draw_page_of_segments(
     """
     # Page bounding
     pdf_canvas.setLineWidth(2)
-    pdf_canvas.rect(0.5 * inch, 0.5 * inch, page_width - 1.0 * inch, page_height - 1.3 * inch)
+    pdf_canvas.rect(_INCH_0_5, _INCH_0_5, page_width - _INCH_1_0, page_height - _INCH_1_3)
 
     draw_firm_name_vertical_center(pdf_canvas, firm_name, page_width, page_height)
 
     pdf_canvas.setFont("Helvetica-Bold", 12)
-    pdf_canvas.drawCentredString(page_width / 2.0, page_height - 0.5 * inch, case_name)
+    pdf_canvas.drawCentredString(page_width / 2.0, page_height - _INCH_0_5, case_name)
     pdf_canvas.setLineWidth(1)
-    pdf_canvas.line(0.5 * inch, page_height - 0.6 * inch, page_width - 0.5 * inch, page_height - 0.6 * inch)
+    pdf_canvas.line(_INCH_0_5, page_height - _INCH_0_6, page_width - _INCH_0_5, page_height - _INCH_0_6)
+
+    # Hoist the columns into locals: the loop below indexes flat lists
+    # instead of doing several dict lookups per line.
+    seg_texts = segments.text
+    seg_fonts = segments.font_name
+    seg_sizes = segments.font_size
+    seg_aligns = segments.alignment
+    seg_headings = segments.is_heading
+    seg_subheadings = segments.is_subheading
+    seg_new_page = segments.page_always_new
+    total_segments = len(seg_texts)
+
+    # A bracket block at the top of the page uses the entire page.
+    if start_index < total_segments and seg_new_page[start_index]:
+        draw_legal_page_title_block(
+            pdf_canvas,
+            page_width,
+            page_height,
+            segments.title_lines[start_index],
+            firm_name,
+            case_name,
+            page_number,
+            total_pages
+        )
+        return start_index + 1  # this page is fully used
 
+    # Decide how many segments fit on this page before drawing anything,
+    # so the gutters and the body can each be drawn as coalesced font runs.
     end_index = start_index
-    current_line_count = 0
-    y_text = line_offset_y
-
-    while end_index < len(segments) and current_line_count < max_lines_per_page:
-        seg = segments[end_index]
-
-        if seg.get("page_always_new"):
-            # bracket block => check if we have already used lines on this page
-            if current_line_count > 0:
-                # finish this page now
-                break
-            else:
-                # use entire page for the block
-                block_lines = seg["lines"]
-                draw_legal_page_title_block(
-                    pdf_canvas,
-                    page_width,
-                    page_height,
-                    block_lines,
-                    firm_name,
-                    case_name,
-                    page_number,
-                    total_pages
-                )
-                end_index += 1
-                return end_index  # this page is fully used
+    while end_index < total_segments and (end_index - start_index) < max_lines_per_page:
+        if seg_new_page[end_index]:
+            # bracket block => finish this page now
+            break
+        end_index += 1
 
-        # Normal line-based segment
-        line_number = end_index + 1
-        # line numbers on left + right
-        pdf_canvas.setFont("Helvetica", 10)
-        pdf_canvas.drawString(line_offset_x - 0.6 * inch, y_text, str(line_number))
-        pdf_canvas.drawString(page_width - 0.4 * inch, y_text, str(line_number))
+    # Line numbers on left + right: one setFont covers the whole page.
+    pdf_canvas.setFont("Helvetica", 10)
+    current_font = ("Helvetica", 10)
+    left_gutter_x = line_offset_x - _INCH_0_6
+    right_gutter_x = page_width - _INCH_0_4
+    y_text = line_offset_y
+    for idx in range(start_index, end_index):
+        line_label = str(idx + 1)
+        pdf_canvas.drawString(left_gutter_x, y_text, line_label)
+        pdf_canvas.drawString(right_gutter_x, y_text, line_label)
+        y_text -= line_spacing
 
+    # Body text: only emit a font switch when the font actually changes,
+    # so runs of same-font lines share a single Tf operator.
+    mid_x = (line_offset_x + (page_width - _INCH_0_5)) / 2.0
+    y_text = line_offset_y
+    for idx in range(start_index, end_index):
         # If heading => store for TOC
-        if seg["is_heading"] or seg["is_subheading"]:
+        if seg_headings[idx] or seg_subheadings[idx]:
             heading_positions.append(
                 (
-                    seg["text"],
+                    seg_texts[idx],
                     page_number,
-                    line_number,
-                    seg["is_subheading"]
+                    idx + 1,
+                    bool(seg_subheadings[idx])
                 )
             )
 
-        # Draw the text
-        pdf_canvas.setFont(seg["font_name"], seg["font_size"])
-        if seg["alignment"] == "center":
-            left_boundary = line_offset_x
-            right_boundary = page_width - 0.5 * inch
-            mid_x = (left_boundary + right_boundary) / 2.0
-            pdf_canvas.drawCentredString(mid_x, y_text, seg["text"])
+        body_font = (seg_fonts[idx], seg_sizes[idx])
+        if body_font != current_font:
+            pdf_canvas.setFont(seg_fonts[idx], seg_sizes[idx])
+            current_font = body_font
+        if seg_aligns[idx] == "center":
+            pdf_canvas.drawCentredString(mid_x, y_text, seg_texts[idx])
         else:
-            pdf_canvas.drawString(line_offset_x, y_text, seg["text"])
-
+            pdf_canvas.drawString(line_offset_x, y_text, seg_texts[idx])
         y_text -= line_spacing
-        current_line_count += 1
-        end_index += 1
 
     # Footer
     pdf_canvas.setFont("Helvetica-Oblique", 9)
     footer_text = f"Page {page_number} of {total_pages}"
-    pdf_canvas.drawCentredString(page_width / 2.0, 0.4 * inch, footer_text)
+    pdf_canvas.drawCentredString(page_width / 2.0, _INCH_0_4, footer_text)
 
     return end_index
 
@@ -673,23 +710,31 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
     """
     Generates a PDF table of contents, listing each heading and subheading, with page#:line# at right.
     """
-    pdf_canvas = canvas.Canvas(index_filename, pagesize=letter)
+    # Write through an explicit buffered handle with per-page compression:
+    # each page's content stream is deflated and flushed at showPage()
+    # instead of accumulating uncompressed until save().
+    index_stream = open(index_filename, 'wb')
+    pdf_canvas = canvas.Canvas(index_stream, pagesize=letter, pageCompression=1)
     pdf_canvas.setTitle("Table of Contents")
 
     page_width, page_height = letter
-    top_margin = 1.0 * inch
-    bottom_margin = 1.0 * inch
-    left_margin = 1.0 * inch
-    right_margin = 0.5 * inch
-    line_spacing = 0.25 * inch
-
-    temp_c = canvas.Canvas("dummy.pdf", pagesize=letter)
-
-    def wrap_text(linestr, font_name, font_size, maxwidth):
-        temp_c.setFont(font_name, font_size)
-        return wrap_text_to_lines(temp_c, linestr, font_name, font_size, maxwidth)
-
-    max_entry_width = page_width - left_margin - 1.5 * inch
+    top_margin = _INCH_1_0
+    left_margin = _INCH_1_0
+    right_margin = _INCH_0_5
+    line_spacing = _INCH_0_25
+
+    max_entry_width = page_width - left_margin - _INCH_1_5
+
+    # Wrap each distinct heading once up front; TOC entries frequently
+    # repeat text, so later occurrences become a dict hit.
+    wrap_cache = {}
+    for (heading_text, _pg_num, _ln_num, is_sub) in heading_positions:
+        cache_key = (heading_text, is_sub)
+        if cache_key not in wrap_cache:
+            if is_sub:
+                wrap_cache[cache_key] = wrap_text_to_lines(heading_text, "Helvetica", 9, max_entry_width)
+            else:
+                wrap_cache[cache_key] = wrap_text_to_lines(heading_text, "Helvetica-Bold", 10, max_entry_width)
 
     # Flatten headings with wrapping
     flattened_lines = []
@@ -703,7 +748,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
             font_size = 10
             bold = True
 
-        wrapped = wrap_text(heading_text, font_name, font_size, max_entry_width)
+        wrapped = wrap_cache[(heading_text, is_sub)]
         text_lines = [w[0] for w in wrapped] if wrapped else [""]
 
         for i, txt_line in enumerate(text_lines):
@@ -719,8 +764,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
                 )
             )
 
-    usable_height = page_height - (top_margin + bottom_margin) - 1.0 * inch
-    max_lines_per_page = int(usable_height // line_spacing)
+    max_lines_per_page = _TOC_MAX_LINES_PER_PAGE
     total_lines = len(flattened_lines)
     total_index_pages = max(1, (total_lines + max_lines_per_page - 1) // max_lines_per_page)
 
@@ -730,21 +774,21 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
     while i < total_lines:
         # bounding
         pdf_canvas.setLineWidth(2)
-        pdf_canvas.rect(0.5 * inch, 0.5 * inch, page_width - 1.0 * inch, page_height - 1.3 * inch)
+        pdf_canvas.rect(_INCH_0_5, _INCH_0_5, page_width - _INCH_1_0, page_height - _INCH_1_3)
 
         draw_firm_name_vertical_center(pdf_canvas, firm_name, page_width, page_height)
 
         pdf_canvas.setFont("Helvetica-Bold", 12)
-        pdf_canvas.drawCentredString(page_width / 2.0, page_height - 0.5 * inch, case_name)
+        pdf_canvas.drawCentredString(page_width / 2.0, page_height - _INCH_0_5, case_name)
         pdf_canvas.setLineWidth(1)
-        pdf_canvas.line(0.5 * inch, page_height - 0.6 * inch, page_width - 0.5 * inch, page_height - 0.6 * inch)
+        pdf_canvas.line(_INCH_0_5, page_height - _INCH_0_6, page_width - _INCH_0_5, page_height - _INCH_0_6)
 
         # Title
         pdf_canvas.setFont("Helvetica-Bold", 14)
-        pdf_canvas.drawCentredString(page_width / 2.0, page_height - 0.75 * inch, "TABLE OF CONTENTS")
+        pdf_canvas.drawCentredString(page_width / 2.0, page_height - _INCH_0_75, "TABLE OF CONTENTS")
 
         x_text = left_margin
-        y_text = page_height - top_margin - 0.75 * inch
+        y_text = page_height - top_margin - _INCH_0_75
         lines_on_this_page = 0
 
         while i < total_lines and lines_on_this_page < max_lines_per_page:
@@ -754,7 +798,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
 
             if show_pageline:
                 label_str = f"{pg_num}:{ln_num}"
-                pdf_canvas.drawRightString(page_width - right_margin - 0.2 * inch, y_text, label_str)
+                pdf_canvas.drawRightString(page_width - right_margin - _INCH_0_2, y_text, label_str)
 
             y_text -= line_spacing
             i += 1
@@ -763,7 +807,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
         # Footer
         pdf_canvas.setFont("Helvetica-Oblique", 9)
         footer_text = f"Index Page {current_page_index} of {total_index_pages}"
-        pdf_canvas.drawCentredString(page_width / 2.0, 0.4 * inch, footer_text)
+        pdf_canvas.drawCentredString(page_width / 2.0, _INCH_0_4, footer_text)
 
         if i < total_lines:
             pdf_canvas.showPage()
@@ -772,11 +816,43 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
             break
 
     pdf_canvas.save()
+    index_stream.close()
 
 
 ###############################################################################
 #  DOCX GENERATION (COMPLAINT + TOC)
 ###############################################################################
+def _emit_header_lines(tail, buffered_lines):
+    """Flush buffered header lines; all-caps lines are centered."""
+    for line in buffered_lines:
+        p = tail.insert_paragraph_before()
+        line_stripped = line.strip()
+        if is_line_all_caps(line_stripped):
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        else:
+            p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        p.add_run(line_stripped)
+
+
+def _emit_body_lines(tail, buffered_lines, font_size):
+    """Flush buffered section-body lines as left-aligned runs of one size."""
+    for bline in buffered_lines:
+        p = tail.insert_paragraph_before()
+        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        rr = p.add_run(bline.strip())
+        rr.font.size = font_size
+
+
+def _emit_title_block(tail, block_lines):
+    """Add bracket-block lines in big bold, centered."""
+    for line in block_lines:
+        p = tail.insert_paragraph_before()
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        runx = p.add_run(line.strip())
+        runx.bold = True
+        runx.font.size = _PT14
+
+
 def generate_complaint_docx(docx_filename, firm_name, case_name, header_od, sections_od, heading_styles):
     """
     Generates a Word document version of the complaint text.
@@ -792,13 +868,19 @@ def generate_complaint_docx(docx_filename, firm_name, case_name, header_od, sect
     style = doc.styles['Normal']
     font = style.font
     font.name = 'Times New Roman'
-    font.size = Pt(12)
+    font.size = _PT12
 
     top_par = doc.add_paragraph()
     top_par.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = top_par.add_run(f"{firm_name} | {case_name}\n")
     run.bold = True
-    run.font.size = Pt(14)
+    run.font.size = _PT14
+
+    # Everything below is inserted before this trailing sentinel:
+    # insert_paragraph_before is O(1) however long the body already is,
+    # whereas add_paragraph re-seeks the insertion point and degrades as
+    # the document grows.  The sentinel is removed before saving.
+    tail = doc.add_paragraph()
 
     # 3) Insert the header content (if any)
     header_content = header_od.get("content", "")
@@ -807,95 +889,52 @@ def generate_complaint_docx(docx_filename, firm_name, case_name, header_od, sect
     buffer_of_lines = []
     for kind, block_lines in detect_legal_title_blocks(header_lines):
         if kind == "legal_page_title_block":
-            # flush normal lines
-            if buffer_of_lines:
-                for line in buffer_of_lines:
-                    p = doc.add_paragraph()
-                    line_stripped = line.strip()
-                    if is_line_all_caps(line_stripped):
-                        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    else:
-                        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    p.add_run(line_stripped)
-                buffer_of_lines = []
-            # now add the bracket-block lines in big bold
-            for line in block_lines:
-                p = doc.add_paragraph()
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                runx = p.add_run(line.strip())
-                runx.bold = True
-                runx.font.size = Pt(14)
+            # flush normal lines, then the bracket-block lines in big bold
+            _emit_header_lines(tail, buffer_of_lines)
+            buffer_of_lines = []
+            _emit_title_block(tail, block_lines)
         else:
             buffer_of_lines.append(block_lines)
 
     # flush leftover from header
-    if buffer_of_lines:
-        for line in buffer_of_lines:
-            p = doc.add_paragraph()
-            line_stripped = line.strip()
-            if is_line_all_caps(line_stripped):
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            else:
-                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            p.add_run(line_stripped)
+    _emit_header_lines(tail, buffer_of_lines)
 
     # 4) Insert each section
     for section_key, section_body in sections_od.items():
         style_type = heading_styles.get(section_key, "section")
+        # Resolved once per section instead of once per body line:
+        body_size = _PT12 if style_type == "section" else _PT11
 
         # blank line
-        doc.add_paragraph()
+        tail.insert_paragraph_before()
 
         # heading
-        heading_para = doc.add_paragraph()
+        heading_para = tail.insert_paragraph_before()
         heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
+        run = heading_para.add_run(section_key)
         if style_type == "section":
-            run = heading_para.add_run(section_key)
             run.bold = True
-            run.font.size = Pt(12)
+            run.font.size = _PT12
         else:
-            run = heading_para.add_run(section_key)
             run.bold = False
-            run.font.size = Pt(11)
+            run.font.size = _PT11
 
         # body lines
         body_lines = section_body.splitlines()
         normal_buffer = []
         for kind, block_lines in detect_legal_title_blocks(body_lines):
             if kind == "legal_page_title_block":
-                if normal_buffer:
-                    for bline in normal_buffer:
-                        bline_str = bline.strip()
-                        p = doc.add_paragraph()
-                        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                        rr = p.add_run(bline_str)
-                        if style_type == "section":
-                            rr.font.size = Pt(12)
-                        else:
-                            rr.font.size = Pt(11)
-                    normal_buffer = []
-                # bracket-block lines in big bold
-                for xline in block_lines:
-                    p = doc.add_paragraph()
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    runx = p.add_run(xline.strip())
-                    runx.bold = True
-                    runx.font.size = Pt(14)
+                _emit_body_lines(tail, normal_buffer, body_size)
+                normal_buffer = []
+                _emit_title_block(tail, block_lines)
             else:
                 normal_buffer.append(block_lines)
 
-        if normal_buffer:
-            for bline in normal_buffer:
-                bline_str = bline.strip()
-                p = doc.add_paragraph()
-                p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                rr = p.add_run(bline_str)
-                if style_type == "section":
-                    rr.font.size = Pt(12)
-                else:
-                    rr.font.size = Pt(11)
-            normal_buffer = []
+        _emit_body_lines(tail, normal_buffer, body_size)
+
+    # Drop the sentinel so it does not leave a stray empty paragraph.
+    tail._element.getparent().remove(tail._element)
 
     doc.save(docx_filename)
     print(f"DOCX complaint saved as: {docx_filename}")
@@ -910,43 +949,39 @@ def generate_toc_docx(docx_filename, firm_name, case_name, heading_positions):
     style = doc.styles['Normal']
     font = style.font
     font.name = 'Times New Roman'
-    font.size = Pt(12)
+    font.size = _PT12
 
     # Title
     top_par = doc.add_paragraph()
     top_par.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = top_par.add_run(f"{firm_name} | {case_name}\nTABLE OF CONTENTS\n")
     run.bold = True
-    run.font.size = Pt(14)
+    run.font.size = _PT14
 
     # Table for the TOC
     table = doc.add_table(rows=0, cols=2)
     table.autofit = True
 
+    # add_row() re-walks the table grid on every call, so filling the TOC
+    # through it is quadratic in the number of headings. Each row is built
+    # as a finished <w:tr> fragment and spliced into the table XML instead.
+    tbl = table._tbl
     for (heading_text, pg_num, ln_num, is_sub) in heading_positions:
-        row_cells = table.add_row().cells
-        left_cell = row_cells[0]
-        right_cell = row_cells[1]
-
         if is_sub:
-            this_font_size = 11
-            this_bold = False
+            half_points = 22  # Pt(11)
+            left_bold = '<w:b w:val="0"/>'
         else:
-            this_font_size = 12
-            this_bold = True
-
-        # Left cell: heading text
-        left_par = left_cell.paragraphs[0]
-        run_left = left_par.add_run(heading_text)
-        run_left.font.size = Pt(this_font_size)
-        run_left.bold = this_bold
-
-        # Right cell: page:line
-        right_par = right_cell.paragraphs[0]
-        run_right = right_par.add_run(f"{pg_num}:{ln_num}")
-        run_right.font.size = Pt(this_font_size)
-        run_right.bold = False
-        right_par.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+            half_points = 24  # Pt(12)
+            left_bold = '<w:b/>'
+        size_xml = f'<w:sz w:val="{half_points}"/><w:szCs w:val="{half_points}"/>'
+        tbl.append(parse_xml(
+            f'<w:tr xmlns:w="{_WORDML_NS}">'
+            f'<w:tc><w:p><w:r><w:rPr>{left_bold}{size_xml}</w:rPr>'
+            f'<w:t xml:space="preserve">{escape(heading_text)}</w:t></w:r></w:p></w:tc>'
+            f'<w:tc><w:p><w:pPr><w:jc w:val="right"/></w:pPr>'
+            f'<w:r><w:rPr><w:b w:val="0"/>{size_xml}</w:rPr>'
+            f'<w:t xml:space="preserve">{pg_num}:{ln_num}</w:t></w:r></w:p></w:tc>'
+            '</w:tr>'))
 
     doc.save(docx_filename)
     print(f"Table of Contents DOCX saved as: {docx_filename}")
@@ -955,31 +990,25 @@ def generate_toc_docx(docx_filename, firm_name, case_name, heading_positions):
 ###############################################################################
 #  PARSING DOCUMENTS FROM TEXT
 ###############################################################################
+# Matches a whole '=====' delimiter line; [^\S\n] is whitespace-except-
+# newline, so leading blanks and a trailing '\r' are part of the match.
+_EQUALS_LINE_RE = re.compile(r'^[^\S\n]*={5,}[^\S\n]*$', re.MULTILINE)
+
 def parse_documents_from_text(raw_text):
     """
     Return a list of bracketed documents found between lines of '=====' in the raw_text.
     """
-    lines = raw_text.splitlines()
+    # One regex pass locates every delimiter line without materializing a
+    # list of all lines; only the bracketed bodies are split afterwards.
+    delimiters = list(_EQUALS_LINE_RE.finditer(raw_text))
     docs = []
-    i = 0
-    n = len(lines)
-
-    while i < n:
-        if is_full_equals_line(lines[i]):
-            j = i + 1
-            doc_lines = []
-            while j < n and not is_full_equals_line(lines[j]):
-                doc_lines.append(lines[j])
-                j += 1
-            if j < n:
-                # found a matching bottom bracket
-                docs.append("\n".join(doc_lines))
-                i = j + 1
-            else:
-                # no match
-                break
-        else:
-            i += 1
+    # Consecutive delimiters bracket one document apiece; a final unpaired
+    # delimiter is ignored, matching the previous line-by-line scan.
+    for k in range(0, len(delimiters) - 1, 2):
+        top = delimiters[k]
+        bottom = delimiters[k + 1]
+        body = raw_text[top.end() + 1:bottom.start()]
+        docs.append("\n".join(body.splitlines()))
     return docs
 
 
@@ -992,34 +1021,41 @@ def parse_header_and_sections(raw_text):
     A recognized heading is "I. HEADING" or "1. HEADING" etc. with the heading text in all caps.
     Return header_od, sections_od
     """
-    header_od = OrderedDict()
-    sections_od = OrderedDict()
+    header_od = {}
+    sections_od = {}
 
     heading_pattern = re.compile(r'^((?:[IVXLCDM]+\.|[0-9]+\.)+)\s+(.*)$', re.IGNORECASE)
     lines = raw_text.splitlines()
+    total = len(lines)
     idx = 0
     header_lines = []
 
+    # Bound methods held in locals keep the per-line loops at LOAD_FAST
+    # cost; these two loops walk every line of the raw complaint text.
+    match = heading_pattern.match
+    append_header = header_lines.append
+
     # find first heading
-    while idx < len(lines):
-        line = lines[idx].rstrip('\n').rstrip('\r')
-        m = heading_pattern.match(line)
+    while idx < total:
+        line = lines[idx].rstrip('\r\n')
+        m = match(line)
         if m:
             heading_number = m.group(1).strip()
             heading_title = m.group(2).strip()
             if is_line_all_caps(heading_title):
                 break
-        header_lines.append(line)
+        append_header(line)
         idx += 1
 
     header_od["content"] = "\n".join(header_lines)
 
     current_heading_key = None
     current_body_lines = []
+    append_body = current_body_lines.append
 
-    while idx < len(lines):
-        line = lines[idx].rstrip('\n').rstrip('\r')
-        m = heading_pattern.match(line)
+    while idx < total:
+        line = lines[idx].rstrip('\r\n')
+        m = match(line)
         if m:
             heading_number = m.group(1).strip()
             heading_title = m.group(2).strip()
@@ -1028,13 +1064,14 @@ def parse_header_and_sections(raw_text):
                 if current_heading_key is not None:
                     sections_od[current_heading_key] = "\n".join(current_body_lines)
                 current_body_lines = []
+                append_body = current_body_lines.append
                 if heading_number.endswith('.'):
                     heading_number = heading_number[:-1]
                 current_heading_key = f"{heading_number} {heading_title}"
             else:
-                current_body_lines.append(line)
+                append_body(line)
         else:
-            current_body_lines.append(line)
+            append_body(line)
         idx += 1
 
     if current_heading_key is not None:
@@ -1047,88 +1084,120 @@ def classify_headings(sections_od):
     If the heading number portion has more than one dot (like "1.1" or "II.1"), it's a subheading.
     Otherwise it's a main section.
     """
-    heading_styles = {}
-    for full_key in sections_od.keys():
-        parts = full_key.split(None, 1)
-        if len(parts) == 2:
-            heading_number, _heading_text = parts[0], parts[1]
-        else:
-            heading_number = parts[0]
-        dot_count = heading_number.count('.')
-        if dot_count > 1:
-            heading_styles[full_key] = "subsection"
-        else:
-            heading_styles[full_key] = "section"
-    return heading_styles
+    # Keys are "<number> <title>", so partition(' ') yields the number
+    # without the throwaway list split(None, 1) would allocate per key.
+    return {
+        full_key: ("subsection" if full_key.partition(' ')[0].count('.') > 1
+                   else "section")
+        for full_key in sections_od
+    }
 
 
 ###############################################################################
 #  PREPARE MAIN TEXT SEGMENTS
 ###############################################################################
-def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canvas, max_text_width):
+class SegmentColumns:
+    """
+    Column-wise storage for the prepared text segments.
+
+    One list per field rather than one dict per segment: the pagination
+    and drawing loops index a handful of flat lists, and the boolean
+    flags live in compact byte arrays instead of dict slots.
+
+    Every column has an entry for every segment — add_line and
+    add_title_block each fill all eight fields — so readers index the
+    columns directly; no .get() probing with defaults is ever needed.
+    """
+
+    __slots__ = (
+        'text', 'font_name', 'font_size', 'alignment',
+        'is_heading', 'is_subheading', 'page_always_new', 'title_lines'
+    )
+
+    def __init__(self):
+        self.text = []
+        self.font_name = []
+        self.font_size = []
+        self.alignment = []
+        self.is_heading = array('b')
+        self.is_subheading = array('b')
+        self.page_always_new = array('b')
+        self.title_lines = []
+
+    def __len__(self):
+        return len(self.text)
+
+    def add_line(self, text, font_name, font_size, alignment,
+                 is_heading=False, is_subheading=False):
+        """Append one normal drawable line."""
+        self.text.append(text)
+        self.font_name.append(font_name)
+        self.font_size.append(font_size)
+        self.alignment.append(alignment)
+        self.is_heading.append(is_heading)
+        self.is_subheading.append(is_subheading)
+        self.page_always_new.append(False)
+        self.title_lines.append(None)
+
+    def add_title_block(self, lines):
+        """Append a bracketed title block that takes a page of its own."""
+        self.text.append("")
+        self.font_name.append("")
+        self.font_size.append(0)
+        self.alignment.append("")
+        self.is_heading.append(False)
+        self.is_subheading.append(False)
+        self.page_always_new.append(True)
+        self.title_lines.append(lines)
+
+
+def _flush_buffered_lines(segments, buffered, font_name, font_size,
+                          max_text_width, center_all_caps=False):
+    """
+    Drain buffered raw lines into segments: blanks pass through, the rest
+    are wrapped to max_text_width. With center_all_caps, all-caps lines
+    are centered (header treatment); otherwise everything is left-aligned.
     """
-    Convert the text into a list of segments:
+    add_line = segments.add_line
+    for line in buffered:
+        line_str = line.strip()
+        if not line_str:
+            # blank line
+            add_line("", font_name, font_size, "left")
+            continue
+        if center_all_caps and is_line_all_caps(line_str):
+            alignment = "center"
+        else:
+            alignment = "left"
+        wrapped = wrap_text_to_lines(line_str, font_name, font_size, max_text_width)
+        for (wl, _) in wrapped:
+            add_line(wl, font_name, font_size, alignment)
+    buffered.clear()
+
+
+def prepare_main_pdf_segments(header_text, sections_od, heading_styles, max_text_width):
+    """
+    Convert the text into SegmentColumns:
       - normal lines: with alignment and font
       - bracket blocks: force new page
       - headings marked with is_heading or is_subheading
     """
-    segments = []
+    segments = SegmentColumns()
+    add_line = segments.add_line
 
     # 1) header lines
     header_lines = header_text.splitlines()
     normal_buffer = []
 
-    def flush_normal_buffer():
-        for line in normal_buffer:
-            line_str = line.strip()
-            if not line_str:
-                # blank line
-                segments.append({
-                    "text": "",
-                    "font_name": "Helvetica",
-                    "font_size": 10,
-                    "alignment": "left",
-                    "is_heading": False,
-                    "is_subheading": False
-                })
-            elif is_line_all_caps(line_str):
-                # center it
-                wrapped = wrap_text_to_lines(pdf_canvas, line_str, "Helvetica", 10, max_text_width)
-                for (wl, _) in wrapped:
-                    segments.append({
-                        "text": wl,
-                        "font_name": "Helvetica",
-                        "font_size": 10,
-                        "alignment": "center",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
-            else:
-                # left
-                wrapped = wrap_text_to_lines(pdf_canvas, line_str, "Helvetica", 10, max_text_width)
-                for (wl, _) in wrapped:
-                    segments.append({
-                        "text": wl,
-                        "font_name": "Helvetica",
-                        "font_size": 10,
-                        "alignment": "left",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
-        normal_buffer.clear()
-
     for kind, block_lines in detect_legal_title_blocks(header_lines):
         if kind == "legal_page_title_block":
-            flush_normal_buffer()
-            lines_cleaned = [ln.strip() for ln in block_lines]
-            segments.append({
-                "legal_page_title": True,
-                "page_always_new": True,
-                "lines": lines_cleaned
-            })
+            _flush_buffered_lines(segments, normal_buffer, "Helvetica", 10,
+                                  max_text_width, center_all_caps=True)
+            segments.add_title_block([ln.strip() for ln in block_lines])
         else:
             normal_buffer.append(block_lines)
-    flush_normal_buffer()
+    _flush_buffered_lines(segments, normal_buffer, "Helvetica", 10,
+                          max_text_width, center_all_caps=True)
 
     # 2) sections
     for section_key, section_body in sections_od.items():
@@ -1149,68 +1218,28 @@ def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canv
             is_subheading = True
 
         # blank line
-        segments.append({
-            "text": "",
-            "font_name": body_font_name,
-            "font_size": body_font_size,
-            "alignment": "left",
-            "is_heading": False,
-            "is_subheading": False
-        })
+        add_line("", body_font_name, body_font_size, "left")
 
         # heading text
-        heading_wrapped = wrap_text_to_lines(pdf_canvas, section_key, heading_font_name, heading_font_size, max_text_width)
+        heading_wrapped = wrap_text_to_lines(section_key, heading_font_name, heading_font_size, max_text_width)
         for (wl, _) in heading_wrapped:
-            segments.append({
-                "text": wl,
-                "font_name": heading_font_name,
-                "font_size": heading_font_size,
-                "alignment": "center",
-                "is_heading": is_heading,
-                "is_subheading": is_subheading
-            })
+            add_line(wl, heading_font_name, heading_font_size, "center",
+                     is_heading=is_heading, is_subheading=is_subheading)
 
         # body
         lines_of_body = section_body.splitlines()
         normal_buffer_sec = []
 
-        def flush_section_buffer():
-            for line in normal_buffer_sec:
-                line_str = line.strip()
-                if not line_str:
-                    segments.append({
-                        "text": "",
-                        "font_name": body_font_name,
-                        "font_size": body_font_size,
-                        "alignment": "left",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
-                else:
-                    wrapped = wrap_text_to_lines(pdf_canvas, line_str, body_font_name, body_font_size, max_text_width)
-                    for (wl, _) in wrapped:
-                        segments.append({
-                            "text": wl,
-                            "font_name": body_font_name,
-                            "font_size": body_font_size,
-                            "alignment": "left",
-                            "is_heading": False,
-                            "is_subheading": False
-                        })
-            normal_buffer_sec.clear()
-
         for kind, block_lines in detect_legal_title_blocks(lines_of_body):
             if kind == "legal_page_title_block":
-                flush_section_buffer()
-                lines_cleaned = [ln.strip() for ln in block_lines]
-                segments.append({
-                    "legal_page_title": True,
-                    "page_always_new": True,
-                    "lines": lines_cleaned
-                })
+                _flush_buffered_lines(segments, normal_buffer_sec,
+                                      body_font_name, body_font_size,
+                                      max_text_width)
+                segments.add_title_block([ln.strip() for ln in block_lines])
             else:
                 normal_buffer_sec.append(block_lines)
-        flush_section_buffer()
+        _flush_buffered_lines(segments, normal_buffer_sec,
+                              body_font_name, body_font_size, max_text_width)
 
     return segments
 
@@ -1218,6 +1247,33 @@ def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canv
 ###############################################################################
 #  MAIN PDF GENERATION
 ###############################################################################
+def paginate_text_segments(page_new_flags, max_lines_per_page):
+    """
+    Compute the starting segment index of every text page in one pass.
+
+    A flagged (bracket-block) segment takes a page of its own; other pages
+    fill until the line limit or the next flagged segment.  The page count
+    falls out as len() of the result, so the layout is walked exactly once
+    instead of once to count and once to render.
+    """
+    page_starts = []
+    append = page_starts.append
+    total = len(page_new_flags)
+    index = 0
+    while index < total:
+        append(index)
+        if page_new_flags[index]:
+            index += 1
+            continue
+        limit = index + max_lines_per_page
+        if limit > total:
+            limit = total
+        index += 1
+        while index < limit and not page_new_flags[index]:
+            index += 1
+    return page_starts
+
+
 def generate_legal_document(
     firm_name,
     case_name,
@@ -1236,7 +1292,10 @@ def generate_legal_document(
     """
 
     page_width, page_height = letter
-    pdf_canvas = canvas.Canvas(output_filename, pagesize=letter)
+    # Same streaming setup as the index: compressed pages released at each
+    # showPage() keep memory flat for long complaints with many exhibits.
+    output_stream = open(output_filename, 'wb')
+    pdf_canvas = canvas.Canvas(output_stream, pagesize=letter, pageCompression=1)
     pdf_canvas.setTitle("Legal Document with Cover Sheet")
     pdf_canvas.setAuthor(firm_name)
     pdf_canvas.setSubject(case_name)
@@ -1248,59 +1307,57 @@ def generate_legal_document(
 
     # (B) Now the main text
     heading_styles = classify_headings(sections_od)
-    top_margin = 1.0 * inch
-    bottom_margin = 1.0 * inch
-    left_margin = 1.2 * inch
-    right_margin = 0.5 * inch
-    line_spacing = 0.25 * inch
+
+    # Build the DOCX version on a worker thread while the PDF renders;
+    # the parsed inputs are not mutated past this point, and both writers
+    # spend their tails in GIL-releasing zlib compression, so the two
+    # outputs overlap instead of running back to back.
+    docx_pool = ThreadPoolExecutor(max_workers=1)
+    docx_future = docx_pool.submit(
+        generate_complaint_docx,
+        docx_filename=os.path.splitext(output_filename)[0] + ".docx",
+        firm_name=firm_name,
+        case_name=case_name,
+        header_od=header_od,
+        sections_od=sections_od,
+        heading_styles=heading_styles
+    )
+
+    top_margin = _INCH_1_0
+    bottom_margin = _INCH_1_0
+    left_margin = _INCH_1_2
+    right_margin = _INCH_0_5
+    line_spacing = _INCH_0_25
 
     usable_height = page_height - (top_margin + bottom_margin)
     max_lines_per_page = int(usable_height // line_spacing)
 
     line_offset_x = left_margin
     line_offset_y = page_height - top_margin
-    max_text_width = page_width - right_margin - line_offset_x - 0.2 * inch
+    max_text_width = page_width - right_margin - line_offset_x - _INCH_0_2
 
     # Prepare text segments
     segments = prepare_main_pdf_segments(
         header_text=header_od.get("content", ""),
         sections_od=sections_od,
         heading_styles=heading_styles,
-        pdf_canvas=pdf_canvas,
         max_text_width=max_text_width
     )
 
-    # Count how many pages the text portion will occupy
-    current_index = 0
-    text_pages = 0
-    total_segments = len(segments)
-    # We already used 1 page for the cover
-    while current_index < total_segments:
-        seg = segments[current_index]
-        if seg.get("page_always_new"):
-            text_pages += 1
-            current_index += 1
-        else:
-            lines_used = 0
-            local_i = current_index
-            while local_i < total_segments and lines_used < max_lines_per_page:
-                s = segments[local_i]
-                if s.get("page_always_new"):
-                    break
-                lines_used += 1
-                local_i += 1
-            text_pages += 1
-            current_index = local_i
+    # Lay the text portion out once: each entry is the first segment of a
+    # page, and the page count is simply the number of entries.
+    # (Page 1 is already used by the cover sheet.)
+    page_starts = paginate_text_segments(segments.page_always_new, max_lines_per_page)
+    text_pages = len(page_starts)
 
     exhibit_pages = len(exhibits)
     # So total pages = 1 cover + text_pages + exhibit_pages
     total_pages = 1 + text_pages + exhibit_pages
 
     # Actually render main text
-    page_number = 2  # since page 1 was cover sheet
-    current_index = 0
-    while current_index < total_segments:
-        next_index = draw_page_of_segments(
+    page_number = 1
+    for page_number, current_index in enumerate(page_starts, start=2):
+        draw_page_of_segments(
             pdf_canvas=pdf_canvas,
             page_width=page_width,
             page_height=page_height,
@@ -1317,10 +1374,29 @@ def generate_legal_document(
             heading_positions=heading_positions
         )
         pdf_canvas.showPage()
-        page_number += 1
-        current_index = next_index
+    page_number += 1
 
     # (C) Exhibits
+    # Decode the images concurrently before the serial render loop: image
+    # decoding releases the GIL, so the disk reads and decompression
+    # overlap instead of stalling each page draw.  Failures are left to
+    # draw_exhibit_page, which renders its usual error message.
+    exhibit_readers = {}
+    if len(exhibits) > 1:
+        def _prefetch(path):
+            try:
+                reader = ImageReader(path)
+                reader.getSize()
+                return reader
+            except Exception:
+                return None
+
+        image_paths = [image_path for (_, image_path) in exhibits]
+        with ThreadPoolExecutor(max_workers=min(8, len(image_paths))) as pool:
+            for image_path, reader in zip(image_paths, pool.map(_prefetch, image_paths)):
+                if reader is not None:
+                    exhibit_readers[image_path] = reader
+
     for (caption, image_path) in exhibits:
         draw_exhibit_page(
             pdf_canvas=pdf_canvas,
@@ -1329,7 +1405,7 @@ def generate_legal_document(
             firm_name=firm_name,
             case_name=case_name,
             exhibit_caption=caption,
-            exhibit_image=image_path,
+            exhibit_image=exhibit_readers.get(image_path, image_path),
             page_number=page_number,
             total_pages=total_pages
         )
@@ -1337,16 +1413,12 @@ def generate_legal_document(
         page_number += 1
 
     pdf_canvas.save()
+    output_stream.close()
 
-    # Also produce the DOCX version (which includes a cover sheet)
-    generate_complaint_docx(
-        docx_filename=os.path.splitext(output_filename)[0] + ".docx",
-        firm_name=firm_name,
-        case_name=case_name,
-        header_od=header_od,
-        sections_od=sections_od,
-        heading_styles=heading_styles
-    )
+    # Join the DOCX build (which includes a cover sheet); any exception it
+    # raised surfaces here, after the PDF is safely on disk.
+    docx_future.result()
+    docx_pool.shutdown()
 
 
 ###############################################################################
@@ -1374,6 +1446,8 @@ def main():
                         help="PDF filename for the table of contents (default: index.pdf).")
     parser.add_argument("--pickle", nargs='?', const=None,
                         help="Optional path to store the Lawsuit object in pickle format. If no path is given, defaults to 'lawsuit.pickle'.")
+    parser.add_argument("--json", nargs='?', const="lawsuit.json", default=None,
+                        help="Optional path to store the Lawsuit object as JSON. If no path is given, defaults to 'lawsuit.json'.")
 
     args = parser.parse_args()
 
@@ -1388,18 +1462,27 @@ def main():
     if len(args.exhibits) % 2 != 0:
         raise ValueError("Exhibits must be in pairs: caption_file image_file")
 
-    exhibits_od = OrderedDict()
-    ex_index = 1
-    for i in range(0, len(args.exhibits), 2):
-        cap_file = args.exhibits[i]
-        img_file = args.exhibits[i + 1]
-        with open(cap_file, 'r', encoding='utf-8') as cfp:
-            cap_text = cfp.read()
-        exhibits_od[str(ex_index)] = OrderedDict([
-            ('caption', cap_text),
-            ('image_path', img_file)
-        ])
-        ex_index += 1
+    cap_files = args.exhibits[0::2]
+    img_files = args.exhibits[1::2]
+
+    def _read_caption(path):
+        with open(path, 'r', encoding='utf-8') as cfp:
+            return cfp.read()
+
+    # Caption files are pure I/O, so read them on a small thread pool and
+    # let the disk waits overlap; a lone caption is not worth a pool.
+    if len(cap_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(cap_files))) as pool:
+            cap_texts = list(pool.map(_read_caption, cap_files))
+    else:
+        cap_texts = [_read_caption(p) for p in cap_files]
+
+    exhibits_od = {}
+    for ex_index, (cap_text, img_file) in enumerate(zip(cap_texts, img_files), start=1):
+        exhibits_od[str(ex_index)] = {
+            'caption': cap_text,
+            'image_path': img_file
+        }
 
     # Some metadata
     header_od["DocumentTitle"] = "Complaint for Tort – Other"
@@ -1408,7 +1491,7 @@ def main():
 
     # Parse bracketed documents from raw_text
     found_documents = parse_documents_from_text(raw_text)
-    documents_od = OrderedDict()
+    documents_od = {}
     for idx, doc_text in enumerate(found_documents, start=1):
         documents_od[str(idx)] = doc_text
 
@@ -1441,6 +1524,10 @@ def main():
         heading_positions=heading_positions
     )
 
+    # The main PDF + DOCX phase churns through large transient strings and
+    # wrapped-line tuples; collect between phases to cap steady-state memory.
+    gc.collect()
+
     # Generate TOC PDF + DOCX
     generate_index_pdf(
         index_filename=args.index,
@@ -1457,6 +1544,8 @@ def main():
         heading_positions=heading_positions
     )
 
+    gc.collect()
+
     # Optionally pickle
     if args.pickle is not None:
         pickle_filename = args.pickle if args.pickle else "lawsuit.pickle"
@@ -1466,12 +1555,20 @@ def main():
     else:
         pkl_path = "Not saved (not requested)."
 
+    # Optionally serialize as JSON (safer and faster to load than pickle)
+    if args.json is not None:
+        lawsuit_obj.save_json(args.json)
+        json_path = args.json
+    else:
+        json_path = "Not saved (not requested)."
+
     # Summary
     print(f"PDF generated: {args.output}")
     print(f"DOCX Complaint generated: {os.path.splitext(args.output)[0] + '.docx'}")
     print(f"Index PDF generated: {args.index}")
     print(f"Index DOCX generated: {index_docx}")
-    print(f"Lawsuit object saved to: {pkl_path}\n")
+    print(f"Lawsuit object saved to: {pkl_path}")
+    print(f"Lawsuit JSON saved to: {json_path}\n")
     print("Dumped Lawsuit object:")
     print(lawsuit_obj)
 
@@ -1,15 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import io
+import json
 import re
 import pickle
 import os
-from collections import OrderedDict
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional C-accelerated JSON encoder; the stdlib is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # PDF-related imports
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 
 # DOCX-related imports
 import docx
@@ -17,24 +29,54 @@ from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Pt, Inches
 
+# Interned segment constants: every appended row shares these exact objects,
+# so the per-row font/alignment comparisons in the draw loop start with a
+# pointer check instead of a character compare, and no duplicate field
+# strings are allocated while building segments.
+_TIMES_ROMAN = sys.intern("Times-Roman")
+_TIMES_BOLD = sys.intern("Times-Bold")
+_ALIGN_LEFT = sys.intern("left")
+_ALIGN_CENTER = sys.intern("center")
+
+# Fixed page geometry for the main document: letter paper with static
+# margins, so everything derived from them is evaluated once at import.
+# (The table-of-contents PDF keeps its own margins.)
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_TOP_MARGIN = 1.0 * inch
+_BOTTOM_MARGIN = 1.0 * inch
+_LEFT_MARGIN = 1.2 * inch
+_RIGHT_MARGIN = 0.5 * inch
+_LINE_SPACING = 0.25 * inch
+_USABLE_HEIGHT = _PAGE_HEIGHT - (_TOP_MARGIN + _BOTTOM_MARGIN)
+_MAX_LINES_PER_PAGE = int(_USABLE_HEIGHT // _LINE_SPACING)
+_LINE_OFFSET_X = _LEFT_MARGIN
+_LINE_OFFSET_Y = _PAGE_HEIGHT - _TOP_MARGIN
+_MAX_TEXT_WIDTH = _PAGE_WIDTH - _RIGHT_MARGIN - _LINE_OFFSET_X - 0.2 * inch
+
 ###############################################################################
 #  LAWSUIT CLASS
 ###############################################################################
 class Lawsuit:
     """
-    A container for Lawsuit data, with each attribute stored as an OrderedDict:
-      - header:   an OrderedDict for storing top-level metadata.
-      - sections: an OrderedDict with each key as "HEADING_NUMBER HEADING_TEXT"
+    A container for Lawsuit data, with each attribute stored as a dict
+    (insertion-ordered on Python 3.7+):
+      - header:   a dict for storing top-level metadata.
+      - sections: a dict with each key as "HEADING_NUMBER HEADING_TEXT"
                   (e.g. "1. INTRODUCTION" or "I. INTRODUCTION"),
                   and each value as the full text of that heading.
-      - exhibits: an OrderedDict keyed by a simple index string ("1", "2", etc.).
-                  Each value is another OrderedDict with 'caption' and 'image_path'.
-      - documents: an OrderedDict for storing entire detected bracketed documents.
+      - exhibits: a dict keyed by a simple index string ("1", "2", etc.).
+                  Each value is another dict with 'caption' and 'image_path'.
+      - documents: a dict for storing entire detected bracketed documents.
 
     This class also automatically stores case_information and law_firm_information
     from command line arguments.
     """
 
+    __slots__ = (
+        'sections', 'exhibits', 'header', 'documents',
+        'case_information', 'law_firm_information'
+    )
+
     def __init__(
         self,
         sections=None,
@@ -44,28 +86,44 @@ class Lawsuit:
         case_information="",
         law_firm_information=""
     ):
-        if sections is None:
-            sections = OrderedDict()
-        if exhibits is None:
-            exhibits = OrderedDict()
-        if header is None:
-            header = OrderedDict()
-        if documents is None:
-            documents = OrderedDict()
-
-        # Ensure they are all OrderedDict:
-        self.sections = OrderedDict(sections)
-        self.exhibits = OrderedDict(exhibits)
-        self.header   = OrderedDict(header)
-        self.documents = OrderedDict(documents)
+        # Ensure they are all plain dicts (insertion order is preserved):
+        self.sections = dict(sections) if sections else {}
+        self.exhibits = dict(exhibits) if exhibits else {}
+        self.header   = dict(header) if header else {}
+        self.documents = dict(documents) if documents else {}
 
         # Store the command-line-provided info
         self.case_information     = case_information
         self.law_firm_information = law_firm_information
 
+    def to_dict(self):
+        """Project the lawsuit onto plain built-ins for JSON serialization."""
+        return {
+            "sections": self.sections,
+            "exhibits": self.exhibits,
+            "header": self.header,
+            "documents": self.documents,
+            "case_information": self.case_information,
+            "law_firm_information": self.law_firm_information,
+        }
+
+    def save_json(self, path):
+        """
+        Serialize the lawsuit as JSON. Uses orjson's C encoder when it is
+        installed -- considerably faster and more compact on the wire than
+        pickling the object graph -- and falls back to the stdlib encoder.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as jf:
+            jf.write(payload)
+
     def __repr__(self):
         """
-        Print the Lawsuit object clearly, showing all keys and values in each OrderedDict fully,
+        Print the Lawsuit object clearly, showing all keys and values in each dict fully,
         as well as the case_information and law_firm_information fields.
         """
         header_str = "\n".join([f"  {k}: {v}" for k, v in self.header.items()])
@@ -123,36 +181,69 @@ def draw_firm_name_vertical_center(pdf_canvas, text, page_width, page_height):
     pdf_canvas.drawString(0, 0, text)
     pdf_canvas.restoreState()
 
-def wrap_text_to_lines(pdf_canvas, full_text, font_name, font_size, max_width):
+@functools.lru_cache(maxsize=65536)
+def _cached_string_width(text, font_name, font_size):
+    """Memoized pdfmetrics.stringWidth for the small set of repeated strings."""
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+@functools.lru_cache(maxsize=8192)
+def wrap_text_to_lines(full_text, font_name, font_size, max_width):
     """
-    Splits a large text into a list of (line_string, ended_full_line) pairs,
+    Splits a large text into a tuple of (line_string, ended_full_line) pairs,
     respecting max_width so that text does not overflow horizontally.
+
+    Widths come from pdfmetrics.stringWidth (no canvas needed), and both the
+    per-string widths and whole wrap results are memoized: legal documents
+    repeat boilerplate lines heavily, so most calls are cache hits.
     """
-    pdf_canvas.setFont(font_name, font_size)
     paragraphs = full_text.split('\n')
     all_lines = []
+    space_width = _cached_string_width(" ", font_name, font_size)
     for paragraph in paragraphs:
         words = paragraph.split()
         if not words:
             # Empty line
             all_lines.append(("", False))
             continue
-        current_line = ""
-        for word in words:
-            if not current_line:
-                test_line = word
-            else:
-                test_line = current_line + " " + word
-
-            if pdf_canvas.stringWidth(test_line, font_name, font_size) <= max_width:
-                current_line = test_line
+        # Common case: the whole paragraph fits on one line, so the wrap
+        # result is just its normalized text -- one width lookup, no
+        # per-word scan.
+        normalized = " ".join(words)
+        if _cached_string_width(normalized, font_name, font_size) <= max_width:
+            all_lines.append((normalized, False))
+            continue
+        # Pass 1: measure each word once. The built-in fonts have no
+        # kerning, so a line's width is the sum of its word widths plus
+        # the separating spaces -- no need to re-measure growing lines.
+        widths = [_cached_string_width(word, font_name, font_size) for word in words]
+        if widths[0] > max_width:
+            # The first word alone overflows; keep the historical
+            # behavior of emitting an empty line before it.
+            all_lines.append(("", True))
+        # Pass 2: scan the widths, slicing out a line whenever the
+        # running total would overflow.
+        start = 0
+        line_width = widths[0]
+        for k in range(1, len(words)):
+            test_width = line_width + space_width + widths[k]
+            if test_width <= max_width:
+                line_width = test_width
             else:
                 # The line overflowed
-                all_lines.append((current_line, True))
-                current_line = word
-        if current_line:
-            all_lines.append((current_line, False))
-    return all_lines
+                all_lines.append((" ".join(words[start:k]), True))
+                start = k
+                line_width = widths[k]
+        all_lines.append((" ".join(words[start:]), False))
+    return tuple(all_lines)
+
+@functools.lru_cache(maxsize=64)
+def _exhibit_image_reader(path):
+    """
+    One ImageReader per exhibit path. ImageReader keeps the decoded image
+    around, so an exhibit referenced more than once is opened and decoded
+    a single time.
+    """
+    return ImageReader(path)
 
 def draw_exhibit_page(
     pdf_canvas,
@@ -192,7 +283,7 @@ def draw_exhibit_page(
     max_caption_width = page_width - (2 * left_margin)
 
     # Wrap the caption
-    wrapped_caption_lines = wrap_text_to_lines(pdf_canvas, exhibit_caption, "Times-Roman", 10, max_caption_width)
+    wrapped_caption_lines = wrap_text_to_lines(exhibit_caption, "Times-Roman", 10, max_caption_width)
     current_y = top_margin
     for (cap_line, _) in wrapped_caption_lines:
         pdf_canvas.drawString(left_margin, current_y, cap_line)
@@ -209,7 +300,10 @@ def draw_exhibit_page(
     available_width = (page_width - 1.0 * inch)  # bounding box from 0.5 inch to page_width-0.5 inch
 
     try:
-        img_reader = ImageReader(exhibit_image)
+        if isinstance(exhibit_image, str):
+            img_reader = _exhibit_image_reader(exhibit_image)
+        else:
+            img_reader = ImageReader(exhibit_image)
         img_width, img_height = img_reader.getSize()
     except Exception as e:
         # If image loading fails, notify in the middle of the page
@@ -385,11 +479,35 @@ def draw_page_of_segments(
     current_line_count = 0
     y_text = line_offset_y
 
-    while end_index < len(segments) and current_line_count < max_lines_per_page:
-        seg = segments[end_index]
-
+    # Batch the page's text into three TextObjects: one per line-number
+    # gutter and one for the body. The gutters keep a single font and
+    # advance by leading; the body only re-emits setFont when the font
+    # actually changes between adjacent segments, so runs of body lines
+    # share one font selection in the content stream.
+    left_gutter = pdf_canvas.beginText(line_offset_x - 0.6 * inch, line_offset_y)
+    left_gutter.setFont("Times-Roman", 10)
+    left_gutter.setLeading(line_spacing)
+    right_gutter = pdf_canvas.beginText(page_width - 0.4 * inch, line_offset_y)
+    right_gutter.setFont("Times-Roman", 10)
+    right_gutter.setLeading(line_spacing)
+    body_text = pdf_canvas.beginText()
+    body_font = None
+
+    # Hoist the segment columns into locals; the loop below then does
+    # plain indexed loads with no attribute lookups per segment.
+    seg_texts = segments.text
+    seg_fonts = segments.font_name
+    seg_sizes = segments.font_size
+    seg_aligns = segments.alignment
+    seg_headings = segments.is_heading
+    seg_subheadings = segments.is_subheading
+    seg_new_page = segments.page_always_new
+    seg_title_lines = segments.title_lines
+    total_segments = len(seg_texts)
+
+    while end_index < total_segments and current_line_count < max_lines_per_page:
         # If this segment is a "legal_page_title_block" forcing new page:
-        if seg.get("page_always_new"):
+        if seg_new_page[end_index]:
             # If we haven't printed anything on this page yet, we can draw it immediately here,
             # otherwise we return so that the main loop will start a fresh page for it.
             if current_line_count > 0:
@@ -397,7 +515,7 @@ def draw_page_of_segments(
                 break
             else:
                 # Draw the single block here on a new page
-                block_lines = seg["lines"]
+                block_lines = seg_title_lines[end_index]
                 draw_legal_page_title_block(
                     pdf_canvas,
                     page_width,
@@ -414,36 +532,47 @@ def draw_page_of_segments(
 
         # Otherwise, normal line-based segment
         line_number = end_index + 1
+        seg_text = seg_texts[end_index]
         # line numbers on left and right
-        pdf_canvas.setFont("Times-Roman", 10)
-        pdf_canvas.drawString(line_offset_x - 0.6 * inch, y_text, str(line_number))
-        pdf_canvas.drawString(page_width - 0.4 * inch, y_text, str(line_number))
+        line_number_str = str(line_number)
+        left_gutter.textLine(line_number_str)
+        right_gutter.textLine(line_number_str)
 
         # If heading => record for table of contents
-        if seg["is_heading"] or seg["is_subheading"]:
+        if seg_headings[end_index] or seg_subheadings[end_index]:
             heading_positions.append(
                 (
-                    seg["text"],
+                    seg_text,
                     page_number,
                     line_number,
-                    seg["is_subheading"]
+                    bool(seg_subheadings[end_index])
                 )
             )
 
         # Draw text according to alignment
-        pdf_canvas.setFont(seg["font_name"], seg["font_size"])
-        if seg["alignment"] == "center":
+        font_name = seg_fonts[end_index]
+        font_size = seg_sizes[end_index]
+        if (font_name, font_size) != body_font:
+            body_text.setFont(font_name, font_size)
+            body_font = (font_name, font_size)
+        if seg_aligns[end_index] == "center":
             left_boundary = line_offset_x
             right_boundary = page_width - 0.5 * inch
             mid_x = (left_boundary + right_boundary) / 2.0
-            pdf_canvas.drawCentredString(mid_x, y_text, seg["text"])
+            half_width = _cached_string_width(seg_text, font_name, font_size) / 2.0
+            body_text.setTextOrigin(mid_x - half_width, y_text)
         else:
-            pdf_canvas.drawString(line_offset_x, y_text, seg["text"])
+            body_text.setTextOrigin(line_offset_x, y_text)
+        body_text.textOut(seg_text)
 
         y_text -= line_spacing
         current_line_count += 1
         end_index += 1
 
+    pdf_canvas.drawText(left_gutter)
+    pdf_canvas.drawText(right_gutter)
+    pdf_canvas.drawText(body_text)
+
     # Footer
     pdf_canvas.setFont("Times-Italic", 9)
     footer_text = f"Page {page_number} of {total_pages}"
@@ -451,6 +580,21 @@ def draw_page_of_segments(
 
     return end_index
 
+###############################################################################
+#  ATOMIC FILE OUTPUT
+###############################################################################
+def _write_file_atomically(filename, payload):
+    """
+    Write the whole payload with a single unbuffered write to a sibling
+    temp file, then rename it into place. Readers never see a partially
+    written document, and the output goes to disk in one large write
+    instead of many small buffered ones.
+    """
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'wb', buffering=0) as f:
+        f.write(payload)
+    os.replace(tmp_filename, filename)
+
 ###############################################################################
 #  TABLE OF CONTENTS (PDF)
 ###############################################################################
@@ -460,7 +604,9 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
     in order encountered in the main PDF (heading_positions). Next to each entry,
     prints the page#:line#.
     """
-    pdf_canvas = canvas.Canvas(index_filename, pagesize=letter)
+    # Render into memory; the file is written in one bulk write below.
+    pdf_buffer = io.BytesIO()
+    pdf_canvas = canvas.Canvas(pdf_buffer, pagesize=letter)
     pdf_canvas.setTitle("Table of Contents")
 
     page_width, page_height = letter
@@ -470,13 +616,6 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
     right_margin = 0.5 * inch
     line_spacing = 0.25 * inch
 
-    # We'll measure text widths with a temporary canvas
-    temp_canvas = canvas.Canvas("dummy.pdf", pagesize=letter)
-
-    def wrap_text(linestr, font_name, font_size, maxwidth):
-        temp_canvas.setFont(font_name, font_size)
-        return wrap_text_to_lines(temp_canvas, linestr, font_name, font_size, maxwidth)
-
     max_entry_width = page_width - left_margin - 1.5 * inch
 
     # Flatten out headings, wrapping as needed
@@ -489,7 +628,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
             font_name = "Times-Bold"
             font_size = 10
 
-        wrapped = wrap_text(heading_text, font_name, font_size, max_entry_width)
+        wrapped = wrap_text_to_lines(heading_text, font_name, font_size, max_entry_width)
         text_lines = [w[0] for w in wrapped] if wrapped else [""]
 
         for i, txt_line in enumerate(text_lines):
@@ -569,6 +708,7 @@ def generate_index_pdf(index_filename, firm_name, case_name, heading_positions):
             break
 
     pdf_canvas.save()
+    _write_file_atomically(index_filename, pdf_buffer.getbuffer())
 
 ###############################################################################
 #  DOCX GENERATION (COMPLAINT + TOC)
@@ -752,14 +892,18 @@ def generate_toc_docx(docx_filename, firm_name, case_name, heading_positions):
 ###############################################################################
 #  ADDITIONAL PARSER FOR MULTIPLE DOCUMENTS
 ###############################################################################
-def parse_documents_from_text(raw_text):
+def parse_documents_from_text(raw_text, lines=None):
     """
     Parse multiple bracketed documents (separated by lines of '=====...') from the raw text.
     Each matched pair of full-equals lines forms one document. Those bracket lines are removed,
     and the content in between is considered a single document.
     Returns a list of document-strings (without the bracket lines).
+
+    A caller that has already split the text may pass the line list to
+    avoid a second O(n) split of the same input.
     """
-    lines = raw_text.splitlines()
+    if lines is None:
+        lines = raw_text.splitlines()
     docs = []
     i = 0
     n = len(lines)
@@ -786,7 +930,7 @@ def parse_documents_from_text(raw_text):
 ###############################################################################
 #  PARSING HEADER AND SECTIONS
 ###############################################################################
-def parse_header_and_sections(raw_text):
+def parse_header_and_sections(raw_text, lines=None):
     """
     Anything before the first valid heading is stored in header['content'].
 
@@ -795,11 +939,12 @@ def parse_header_and_sections(raw_text):
            repeated one or more times, e.g. "I. ", "1. ", "II.1. ", etc.
         2) The text portion after that must be all-caps to qualify as a heading.
     """
-    header_od = OrderedDict()
-    sections_od = OrderedDict()
+    header_od = {}
+    sections_od = {}
 
     heading_pattern = re.compile(r'^((?:[IVXLCDM]+\.|[0-9]+\.)+)\s+(.*)$', re.IGNORECASE)
-    lines = raw_text.splitlines()
+    if lines is None:
+        lines = raw_text.splitlines()
     idx = 0
     header_lines = []
 
@@ -868,72 +1013,94 @@ def classify_headings(sections_od):
 ###############################################################################
 #  BUILDING SEGMENTS
 ###############################################################################
-def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canvas, max_text_width):
+class SegmentColumns:
+    """
+    Column-oriented storage for the renderable segments (struct-of-arrays).
+
+    Instead of one dict per segment, each field lives in its own parallel
+    list or byte array, indexed by segment number:
+      - text:            the line string ("" for blanks and title blocks)
+      - font_name:       "Times-Roman" or "Times-Bold"
+      - font_size:       10 or 9
+      - alignment:       "left" or "center"
+      - is_heading:      array('b') flag
+      - is_subheading:   array('b') flag
+      - page_always_new: array('b') flag (True only for bracketed title blocks)
+      - title_lines:     the bracketed block's lines, or None for normal rows
+
+    The pagination and draw loops index these flat columns directly, so the
+    hot paths do list/array loads instead of per-segment dict lookups.
     """
-    Create a list of segments. Each segment is a dict describing how to render that line or block:
-      {
-        "text": <string line>,
-        "font_name": "Times-Roman" or "Times-Bold",
-        "font_size": 10 or 9,
-        "alignment": "left" or "center",
-        "is_heading": bool,
-        "is_subheading": bool
-      }
-      ...OR...
-      {
-        "legal_page_title": True,
-        "page_always_new": True,
-        "lines": [strings in bracketed block]
-      }
+
+    __slots__ = (
+        'text', 'font_name', 'font_size', 'alignment',
+        'is_heading', 'is_subheading', 'page_always_new', 'title_lines'
+    )
+
+    def __init__(self):
+        self.text = []
+        self.font_name = []
+        self.font_size = []
+        self.alignment = []
+        self.is_heading = array('b')
+        self.is_subheading = array('b')
+        self.page_always_new = array('b')
+        self.title_lines = []
+
+    def __len__(self):
+        return len(self.text)
+
+    def add_line(self, text, font_name, font_size, alignment, is_heading, is_subheading):
+        self.text.append(text)
+        self.font_name.append(font_name)
+        self.font_size.append(font_size)
+        self.alignment.append(alignment)
+        self.is_heading.append(is_heading)
+        self.is_subheading.append(is_subheading)
+        self.page_always_new.append(False)
+        self.title_lines.append(None)
+
+    def add_title_block(self, lines):
+        self.text.append("")
+        self.font_name.append(_TIMES_ROMAN)
+        self.font_size.append(10)
+        self.alignment.append(_ALIGN_LEFT)
+        self.is_heading.append(False)
+        self.is_subheading.append(False)
+        self.page_always_new.append(True)
+        self.title_lines.append(lines)
+
+def prepare_main_pdf_segments(header_text, sections_od, heading_styles, max_text_width):
+    """
+    Create the SegmentColumns describing how to render each line or block.
 
     We detect bracketed blocks (legal_page_title_block) and ensure each one
-    will start on its own page by using "page_always_new": True.
+    will start on its own page via the page_always_new flag.
 
     We also wrap normal lines to fit max_text_width.
     """
-    segments = []
+    segments = SegmentColumns()
 
     # 1) handle header lines (and bracketed blocks in them)
     header_lines = header_text.splitlines()
     normal_buffer = []
 
     def flush_normal_buffer():
-        for line in normal_buffer:
-            line_str = line.strip()
+        # One C-level pass strips the whole buffer; the loop just branches.
+        for line_str in map(str.strip, normal_buffer):
             if not line_str:
                 # blank line
-                segments.append({
-                    "text": "",
-                    "font_name": "Times-Roman",
-                    "font_size": 10,
-                    "alignment": "left",
-                    "is_heading": False,
-                    "is_subheading": False
-                })
+                segments.add_line("", _TIMES_ROMAN, 10, _ALIGN_LEFT, False, False)
             elif is_line_all_caps(line_str):
                 # center it
-                wrapped = wrap_text_to_lines(pdf_canvas, line_str, "Times-Roman", 10, max_text_width)
+                wrapped = wrap_text_to_lines(line_str, _TIMES_ROMAN, 10, max_text_width)
                 for (wl, _) in wrapped:
-                    segments.append({
-                        "text": wl,
-                        "font_name": "Times-Roman",
-                        "font_size": 10,
-                        "alignment": "center",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
+                    segments.add_line(wl, _TIMES_ROMAN, 10, _ALIGN_CENTER, False, False)
             else:
                 # left
-                wrapped = wrap_text_to_lines(pdf_canvas, line_str, "Times-Roman", 10, max_text_width)
+                wrapped = wrap_text_to_lines(line_str, _TIMES_ROMAN, 10, max_text_width)
                 for (wl, _) in wrapped:
-                    segments.append({
-                        "text": wl,
-                        "font_name": "Times-Roman",
-                        "font_size": 10,
-                        "alignment": "left",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
+                    segments.add_line(wl, _TIMES_ROMAN, 10, _ALIGN_LEFT, False, False)
         normal_buffer.clear()
 
     for kind, block_lines in detect_legal_title_blocks(header_lines):
@@ -941,88 +1108,73 @@ def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canv
             if normal_buffer:
                 flush_normal_buffer()
             lines_cleaned = [ln.strip() for ln in block_lines]
-            segments.append({
-                "legal_page_title": True,
-                "page_always_new": True,  # ensure it starts on a new page
-                "lines": lines_cleaned
-            })
+            # ensure it starts on a new page
+            segments.add_title_block(lines_cleaned)
         else:
             normal_buffer.append(block_lines)
 
     if normal_buffer:
         flush_normal_buffer()
 
-    # 2) handle each section
+    # 2) wrap each distinct heading once up front; count titles repeat in
+    # boilerplate complaints, and the section loop below then just looks
+    # the wrapped lines up.
+    heading_wrap_cache = {}
+    for section_key in sections_od:
+        if heading_styles.get(section_key, "section") == "section":
+            cache_key = (section_key, _TIMES_BOLD, 10)
+        else:
+            cache_key = (section_key, _TIMES_ROMAN, 9)
+        if cache_key not in heading_wrap_cache:
+            heading_wrap_cache[cache_key] = wrap_text_to_lines(
+                section_key, cache_key[1], cache_key[2], max_text_width
+            )
+
+    # 3) handle each section
     for section_key, section_body in sections_od.items():
         style = heading_styles.get(section_key, "section")
         if style == "section":
-            heading_font_name = "Times-Bold"
+            heading_font_name = _TIMES_BOLD
             heading_font_size = 10
-            body_font_name = "Times-Roman"
+            body_font_name = _TIMES_ROMAN
             body_font_size = 10
             is_heading = True
             is_subheading = False
         else:
-            heading_font_name = "Times-Roman"
+            heading_font_name = _TIMES_ROMAN
             heading_font_size = 9
-            body_font_name = "Times-Roman"
+            body_font_name = _TIMES_ROMAN
             body_font_size = 9
             is_heading = False
             is_subheading = True
 
         # Add a blank line
-        segments.append({
-            "text": "",
-            "font_name": body_font_name,
-            "font_size": body_font_size,
-            "alignment": "left",
-            "is_heading": False,
-            "is_subheading": False
-        })
+        segments.add_line("", body_font_name, body_font_size, _ALIGN_LEFT, False, False)
 
         # Heading line(s) (wrapped if needed)
-        heading_wrapped = wrap_text_to_lines(
-            pdf_canvas, section_key, heading_font_name, heading_font_size, max_text_width
-        )
+        heading_wrapped = heading_wrap_cache[
+            (section_key, heading_font_name, heading_font_size)
+        ]
         for (wl, _) in heading_wrapped:
-            segments.append({
-                "text": wl,
-                "font_name": heading_font_name,
-                "font_size": heading_font_size,
-                "alignment": "center",
-                "is_heading": is_heading,
-                "is_subheading": is_subheading
-            })
+            segments.add_line(
+                wl, heading_font_name, heading_font_size, _ALIGN_CENTER,
+                is_heading, is_subheading
+            )
 
         # Then body lines + possible bracket blocks
         lines_of_body = section_body.splitlines()
         normal_buffer_sec = []
 
         def flush_section_buffer():
-            for line in normal_buffer_sec:
-                line_str = line.strip()
+            for line_str in map(str.strip, normal_buffer_sec):
                 if not line_str:
-                    segments.append({
-                        "text": "",
-                        "font_name": body_font_name,
-                        "font_size": body_font_size,
-                        "alignment": "left",
-                        "is_heading": False,
-                        "is_subheading": False
-                    })
+                    segments.add_line("", body_font_name, body_font_size, _ALIGN_LEFT, False, False)
                 else:
                     wrapped = wrap_text_to_lines(
-                        pdf_canvas, line_str, body_font_name, body_font_size, max_text_width
+                        line_str, body_font_name, body_font_size, max_text_width
                     )
                     for (wl, _) in wrapped:
-                        segments.append({
-                            "text": wl,
-                            "font_name": body_font_name,
-                            "font_size": body_font_size,
-                            "alignment": "left",
-                            "is_heading": False,
-                            "is_subheading": False
-                        })
+                        segments.add_line(wl, body_font_name, body_font_size, _ALIGN_LEFT, False, False)
             normal_buffer_sec.clear()
 
         for kind, block_lines in detect_legal_title_blocks(lines_of_body):
@@ -1030,11 +1182,8 @@ def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canv
                 if normal_buffer_sec:
                     flush_section_buffer()
                 lines_cleaned = [ln.strip() for ln in block_lines]
-                segments.append({
-                    "legal_page_title": True,
-                    "page_always_new": True,  # force a new page for bracket block
-                    "lines": lines_cleaned
-                })
+                # force a new page for the bracket block
+                segments.add_title_block(lines_cleaned)
             else:
                 normal_buffer_sec.append(block_lines)
 
@@ -1046,6 +1195,33 @@ def prepare_main_pdf_segments(header_text, sections_od, heading_styles, pdf_canv
 ###############################################################################
 #  MAIN PDF GENERATION
 ###############################################################################
+def paginate_text_segments(page_new_flags, max_lines_per_page):
+    """
+    Compute the segment index at which each text page starts, given a byte
+    array flagging which segments force a fresh page. A flagged segment
+    consumes a whole page by itself; anything else fills pages up to
+    max_lines_per_page lines, stopping early when a flagged segment is
+    reached.
+
+    The pagination is decided once here — the page count is simply the
+    length of the returned list, and the drawing loop walks the same
+    starts — so the fitting logic no longer runs twice over the segments.
+    """
+    total_segments = len(page_new_flags)
+    page_starts = []
+    i = 0
+    while i < total_segments:
+        page_starts.append(i)
+        if page_new_flags[i]:
+            i += 1
+            continue
+        limit = i + max_lines_per_page
+        if limit > total_segments:
+            limit = total_segments
+        while i < limit and not page_new_flags[i]:
+            i += 1
+    return page_starts
+
 def generate_legal_document(
     firm_name,
     case_name,
@@ -1059,8 +1235,10 @@ def generate_legal_document(
     Generate the main PDF with line-numbered text (including bracket-block pages).
     Then append exhibits. Also produce a DOCX version of the same content.
     """
-    page_width, page_height = letter
-    pdf_canvas = canvas.Canvas(output_filename, pagesize=letter)
+    page_width, page_height = _PAGE_WIDTH, _PAGE_HEIGHT
+    # Render into memory; the file is written in one bulk write below.
+    pdf_buffer = io.BytesIO()
+    pdf_canvas = canvas.Canvas(pdf_buffer, pagesize=letter)
     pdf_canvas.setTitle("Legal Document")
     pdf_canvas.setAuthor(firm_name)
     pdf_canvas.setSubject(case_name)
@@ -1068,62 +1246,32 @@ def generate_legal_document(
 
     heading_styles = classify_headings(sections_od)
 
-    top_margin = 1.0 * inch
-    bottom_margin = 1.0 * inch
-    left_margin = 1.2 * inch
-    right_margin = 0.5 * inch
-    line_spacing = 0.25 * inch
-
-    usable_height = page_height - (top_margin + bottom_margin)
-    max_lines_per_page = int(usable_height // line_spacing)
-    line_offset_x = left_margin
-    line_offset_y = page_height - top_margin
-    max_text_width = page_width - right_margin - line_offset_x - 0.2 * inch
+    line_spacing = _LINE_SPACING
+    max_lines_per_page = _MAX_LINES_PER_PAGE
+    line_offset_x = _LINE_OFFSET_X
+    line_offset_y = _LINE_OFFSET_Y
+    max_text_width = _MAX_TEXT_WIDTH
 
     # Build segments for main content
     segments = prepare_main_pdf_segments(
         header_text=header_od.get("content", ""),
         sections_od=sections_od,
         heading_styles=heading_styles,
-        pdf_canvas=pdf_canvas,
         max_text_width=max_text_width
     )
 
-    # Count how many pages the text segments will require
-    current_index = 0
-    text_pages = 0
-    total_segments = len(segments)
-
-    while current_index < total_segments:
-        seg = segments[current_index]
-        if seg.get("page_always_new"):
-            # This block alone will consume one full page
-            text_pages += 1
-            current_index += 1
-        else:
-            # We can fit up to max_lines_per_page segments on this page
-            lines_used = 0
-            local_i = current_index
-            while local_i < total_segments and lines_used < max_lines_per_page:
-                s = segments[local_i]
-                if s.get("page_always_new"):
-                    # must stop to start new page for that block
-                    break
-                lines_used += 1
-                local_i += 1
-            text_pages += 1
-            current_index = local_i
+    # Decide the pagination once; the page count falls out of it
+    page_starts = paginate_text_segments(segments.page_always_new, max_lines_per_page)
+    text_pages = len(page_starts)
 
     # The total number of exhibit pages is the number of exhibits
     exhibit_pages = len(exhibits)
     total_pages = text_pages + exhibit_pages
 
-    # Actually render the text segments
-    page_number = 1
-    current_index = 0
-    while current_index < total_segments:
-        # Start a new page
-        next_index = draw_page_of_segments(
+    # Actually render the text segments, one precomputed page at a time
+    page_number = 0
+    for page_number, current_index in enumerate(page_starts, start=1):
+        draw_page_of_segments(
             pdf_canvas=pdf_canvas,
             page_width=page_width,
             page_height=page_height,
@@ -1140,8 +1288,21 @@ def generate_legal_document(
             heading_positions=heading_positions
         )
         pdf_canvas.showPage()
-        page_number += 1
-        current_index = next_index
+    page_number += 1
+
+    # Decode the exhibit images concurrently before the serial draw loop:
+    # the image libraries release the GIL while decoding, so warming the
+    # ImageReader cache from a thread pool overlaps the decode work, and
+    # the per-page drawing below is all cache hits.
+    image_paths = [p for (_, p) in exhibits if isinstance(p, str)]
+    if len(image_paths) > 1:
+        def _prefetch(path):
+            try:
+                _exhibit_image_reader(path).getSize()
+            except Exception:
+                pass  # draw_exhibit_page reports unloadable images on the page
+        with ThreadPoolExecutor(max_workers=min(4, len(image_paths))) as pool:
+            pool.map(_prefetch, image_paths)
 
     # Render each exhibit on its own page
     for (caption, image_path) in exhibits:
@@ -1160,6 +1321,7 @@ def generate_legal_document(
         page_number += 1
 
     pdf_canvas.save()
+    _write_file_atomically(output_filename, pdf_buffer.getbuffer())
 
     # Also generate DOCX
     generate_complaint_docx(
@@ -1199,31 +1361,41 @@ def main():
                             "Optional path to store the Lawsuit object in pickle format. "
                             "If no path is given, defaults to 'lawsuit.pickle'."
                         ))
+    parser.add_argument("--json", nargs='?', const="lawsuit.json", default=None,
+                        help=(
+                            "Optional path to store the Lawsuit object as JSON. "
+                            "If no path is given, defaults to 'lawsuit.json'."
+                        ))
 
     args = parser.parse_args()
 
-    # Read the raw text from the file
-    with open(args.file, 'r', encoding='utf-8') as f:
-        raw_text = f.read()
+    # Read the raw text from the file in one unbuffered bulk read and
+    # decode once, instead of funneling it through the default 8 KB
+    # text-layer buffer.
+    with open(args.file, 'rb', buffering=0) as f:
+        raw_text = f.read().decode('utf-8')
+
+    # Split the text once; both parsers scan the same line list.
+    raw_lines = raw_text.splitlines()
 
     # Parse out header and sections
-    header_od, sections_od = parse_header_and_sections(raw_text)
+    header_od, sections_od = parse_header_and_sections(raw_text, raw_lines)
 
     # Build exhibits
     if len(args.exhibits) % 2 != 0:
         raise ValueError("Exhibits must be in pairs: CAPTION_FILE IMAGE_FILE")
 
-    exhibits_od = OrderedDict()
+    exhibits_od = {}
     ex_index = 1
     for i in range(0, len(args.exhibits), 2):
         cap_file = args.exhibits[i]
         image_file = args.exhibits[i + 1]
         with open(cap_file, 'r', encoding='utf-8') as cfp:
             cap_text = cfp.read()
-        exhibits_od[str(ex_index)] = OrderedDict([
-            ('caption', cap_text),
-            ('image_path', image_file)
-        ])
+        exhibits_od[str(ex_index)] = {
+            'caption': cap_text,
+            'image_path': image_file
+        }
         ex_index += 1
 
     # Add sample metadata to the header (you can adjust or remove this as needed)
@@ -1232,8 +1404,11 @@ def main():
     header_od["Court"] = "Sample Court"
 
     # Parse bracketed documents from raw_text (if any). Each bracket-block pair is considered a separate document.
-    found_documents = parse_documents_from_text(raw_text)
-    documents_od = OrderedDict()
+    found_documents = parse_documents_from_text(raw_text, raw_lines)
+    # Both parsers are done with the raw text; drop the largest transient
+    # allocations before the PDF pipeline runs.
+    del raw_text, raw_lines
+    documents_od = {}
     if found_documents:
         for idx, doc_text in enumerate(found_documents, start=1):
             documents_od[str(idx)] = doc_text
@@ -1291,12 +1466,21 @@ def main():
     else:
         pkl_path = "Not saved (not requested)."
 
+    # Optionally serialize as JSON (faster and smaller than pickle,
+    # especially with orjson installed)
+    if args.json is not None:
+        lawsuit_obj.save_json(args.json)
+        json_path = args.json
+    else:
+        json_path = "Not saved (not requested)."
+
     # Summary
     print(f"PDF generated: {args.output}")
     print(f"DOCX Complaint generated: {os.path.splitext(args.output)[0] + '.docx'}")
     print(f"Index PDF generated: {args.index}")
     print(f"Index DOCX generated: {index_docx}")
-    print(f"Lawsuit object saved to: {pkl_path}\n")
+    print(f"Lawsuit object saved to: {pkl_path}")
+    print(f"Lawsuit JSON saved to: {json_path}\n")
     print("Dumped Lawsuit object:")
     print(lawsuit_obj)
 